@@ -151,6 +151,8 @@ class AutonomousDaemon:
                 capture_output=True
             )
             self._log("INFO", f"Committed: {message[:50]}")
+            if self.quality_mcp:
+                self.quality_mcp.invalidate_standards_cache()
             return True
         except subprocess.CalledProcessError as e:
             self._log("ERROR", f"Commit failed: {e}")
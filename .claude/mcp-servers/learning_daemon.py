@@ -7,11 +7,11 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
-# Add mcp-servers to path
-sys.path.insert(0, str(Path(__file__).parent / "mcp-servers"))
+# learning_mcp.py lives alongside this script
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 try:
-    from learning_mcp import search_best_practices
+    from learning_mcp import LearningServer
 except ImportError:
     print("Error: learning_mcp.py not found")
     sys.exit(1)
@@ -24,12 +24,13 @@ def run_learning_cycle():
     print(f"Topics: {', '.join(topics)}")
     print("")
 
+    # Research plans are built locally (no network), so topics run in order
+    server = LearningServer()
     for topic in topics:
-        print(f"Searching: {topic}...")
-        result = search_best_practices(topic, max_results=3)
-
-        if result["success"]:
-            print(f"  ✅ Search complete: {len(result.get('queries', []))} queries")
+        result = server.research_domain_topic(topic)
+        print(f"{topic}:")
+        if result.get("success"):
+            print(f"  ✅ Search complete: {len(result.get('search_queries', []))} queries")
         else:
             print(f"  ❌ Search failed: {result.get('error', 'Unknown error')}")
 
@@ -40,6 +40,76 @@ ANTHROPIC_COOKBOOKS_REPO = "https://github.com/anthropics/claude-cookbooks"
 ANTHROPIC_QUICKSTARTS_REPO = "https://github.com/anthropics/claude-quickstarts"
 ANTHROPIC_ORG_URL = "https://github.com/orgs/anthropics/repositories"
 
+# Domain detection patterns for map_objective_to_domains (keywords match as substrings)
+DOMAIN_PATTERNS = {
+    "project_management": {
+        "keywords": ["project management", "pm", "agile", "scrum", "kanban", "sprint", "backlog", "jira", "roadmap"],
+        "sources": [
+            "https://www.pmi.org/",
+            "https://www.scrum.org/",
+            "https://www.atlassian.com/agile",
+            "https://asana.com/resources/project-management",
+            "https://www.scrumalliance.org/"
+        ],
+        "search_terms": ["project management best practices", "agile methodologies", "PM tools comparison", "sprint planning techniques"]
+    },
+    "optimization": {
+        "keywords": ["optimization", "optimize", "performance", "efficiency", "solver", "algorithm", "constraint", "minimize", "maximize"],
+        "sources": [
+            "https://optimization.cbe.cornell.edu/",
+            "https://neos-guide.org/",
+            "https://scipbook.readthedocs.io/",
+            "https://docs.scipy.org/doc/scipy/reference/optimize.html",
+            "https://or.stackexchange.com/"
+        ],
+        "search_terms": ["optimization algorithms", "solver techniques", "constraint programming", "linear programming best practices"]
+    },
+    "documentation": {
+        "keywords": ["documentation", "docs", "document", "technical writing", "readme", "api docs", "template", "markdown"],
+        "sources": [
+            "https://www.writethedocs.org/",
+            "https://developers.google.com/tech-writing",
+            "https://documentation.divio.com/",
+            "https://github.com/github/docs",
+            "https://www.markdownguide.org/"
+        ],
+        "search_terms": ["technical documentation best practices", "API documentation templates", "documentation methodologies", "README examples"]
+    },
+    "claude_development": {
+        "keywords": ["claude", "mcp", "skill", "anthropic", "ai assistant", "prompt", "best practice"],
+        "sources": [
+            "https://docs.anthropic.com/",
+            "https://github.com/anthropics/",
+            "https://modelcontextprotocol.io/",
+            "https://code.claude.com/docs",
+            "https://github.com/anthropics/skills"
+        ],
+        "search_terms": ["Claude Code best practices", "MCP server development", "Claude skills creation", "Anthropic API usage"]
+    },
+    "web_development": {
+        "keywords": ["web", "frontend", "backend", "api", "react", "node", "javascript", "typescript", "html", "css"],
+        "sources": [
+            "https://developer.mozilla.org/",
+            "https://web.dev/",
+            "https://react.dev/",
+            "https://nodejs.org/docs/",
+            "https://github.com/airbnb/javascript"
+        ],
+        "search_terms": ["web development best practices", "React patterns", "API design", "frontend performance"]
+    },
+    "data_science": {
+        "keywords": ["data", "analysis", "machine learning", "ml", "ai", "model", "training", "dataset", "pandas", "numpy"],
+        "sources": [
+            "https://scikit-learn.org/",
+            "https://www.kaggle.com/",
+            "https://pytorch.org/docs/",
+            "https://www.tensorflow.org/",
+            "https://pandas.pydata.org/"
+        ],
+        "search_terms": ["data science best practices", "ML model training", "data analysis techniques", "feature engineering"]
+    }
+}
+
 
 class LearningServer:
     """Learning server for continuous improvement."""
@@ -657,11 +727,13 @@ Generate structured recommendations:
             else:
                 raise ValueError(f"Unknown prompt: {name}")
 
-    def detect_project_objective(self, project_path: str) -> Dict:
+    def detect_project_objective(self, project_path: str, *, plan_text: Optional[str] = None) -> Dict:
         """Detect and load project objective from PROJECT_PLAN.md or Project MCP.
 
         Args:
             project_path: Absolute path to project root directory
+            plan_text: PROJECT_PLAN.md content already in hand; when given,
+                no plan file is searched for or read
 
         Returns:
             Dictionary with objective data including problem, users, solution, etc.
@@ -671,33 +743,32 @@ Generate structured recommendations:
             if not project_dir.exists():
                 return {"error": f"Project path not found: {project_path}"}
 
-            # Try to read from docs/notes/PROJECT_PLAN.md
-            plan_file = project_dir / "docs" / "notes" / "PROJECT_PLAN.md"
-
-            if not plan_file.exists():
-                # Try alternative locations
-                plan_file = project_dir / "docs" / "PROJECT_PLAN.md"
-                if not plan_file.exists():
-                    plan_file = project_dir / "PROJECT_PLAN.md"
-                    if not plan_file.exists():
-                        return {
-                            "error": "PROJECT_PLAN.md not found",
-                            "searched_paths": [
-                                str(project_dir / "docs" / "notes" / "PROJECT_PLAN.md"),
-                                str(project_dir / "docs" / "PROJECT_PLAN.md"),
-                                str(project_dir / "PROJECT_PLAN.md")
-                            ],
-                            "suggestion": "Create PROJECT_PLAN.md or use Project MCP to define objective"
-                        }
+            plan_file = None
+            content = plan_text
+
+            if content is None:
+                # Try docs/notes/PROJECT_PLAN.md, then alternative locations
+                candidates = [
+                    project_dir / "docs" / "notes" / "PROJECT_PLAN.md",
+                    project_dir / "docs" / "PROJECT_PLAN.md",
+                    project_dir / "PROJECT_PLAN.md"
+                ]
+                plan_file = next((candidate for candidate in candidates if candidate.exists()), None)
+                if plan_file is None:
+                    return {
+                        "error": "PROJECT_PLAN.md not found",
+                        "searched_paths": [str(candidate) for candidate in candidates],
+                        "suggestion": "Create PROJECT_PLAN.md or use Project MCP to define objective"
+                    }
 
-            # Read and parse PROJECT_PLAN.md
-            content = plan_file.read_text()
+                # Read and parse PROJECT_PLAN.md
+                content = plan_file.read_text()
 
             # Extract objective sections using regex
             objective_data = {
                 "project_path": project_path,
                 "project_name": project_dir.name,
-                "plan_file": str(plan_file)
+                "plan_file": str(plan_file) if plan_file is not None else None
             }
 
             # Extract key sections
@@ -725,7 +796,7 @@ Generate structured recommendations:
             return {
                 "success": True,
                 "objective": objective_data,
-                "message": f"Project objective loaded from {plan_file.name}",
+                "message": f"Project objective loaded from {plan_file.name if plan_file is not None else 'provided plan text'}",
                 "next_step": "Call map_objective_to_domains to identify research areas"
             }
 
@@ -754,88 +825,18 @@ Generate structured recommendations:
             # Combine all text for analysis
             combined_text = f"{project_name} {title} {problem} {solution}"
 
-            # Domain detection patterns
-            domain_patterns = {
-                "project_management": {
-                    "keywords": ["project management", "pm", "agile", "scrum", "kanban", "sprint", "backlog", "jira", "roadmap"],
-                    "sources": [
-                        "https://www.pmi.org/",
-                        "https://www.scrum.org/",
-                        "https://www.atlassian.com/agile",
-                        "https://asana.com/resources/project-management",
-                        "https://www.scrumalliance.org/"
-                    ],
-                    "search_terms": ["project management best practices", "agile methodologies", "PM tools comparison", "sprint planning techniques"]
-                },
-                "optimization": {
-                    "keywords": ["optimization", "optimize", "performance", "efficiency", "solver", "algorithm", "constraint", "minimize", "maximize"],
-                    "sources": [
-                        "https://optimization.cbe.cornell.edu/",
-                        "https://neos-guide.org/",
-                        "https://scipbook.readthedocs.io/",
-                        "https://docs.scipy.org/doc/scipy/reference/optimize.html",
-                        "https://or.stackexchange.com/"
-                    ],
-                    "search_terms": ["optimization algorithms", "solver techniques", "constraint programming", "linear programming best practices"]
-                },
-                "documentation": {
-                    "keywords": ["documentation", "docs", "document", "technical writing", "readme", "api docs", "template", "markdown"],
-                    "sources": [
-                        "https://www.writethedocs.org/",
-                        "https://developers.google.com/tech-writing",
-                        "https://documentation.divio.com/",
-                        "https://github.com/github/docs",
-                        "https://www.markdownguide.org/"
-                    ],
-                    "search_terms": ["technical documentation best practices", "API documentation templates", "documentation methodologies", "README examples"]
-                },
-                "claude_development": {
-                    "keywords": ["claude", "mcp", "skill", "anthropic", "ai assistant", "prompt", "best practice"],
-                    "sources": [
-                        "https://docs.anthropic.com/",
-                        "https://github.com/anthropics/",
-                        "https://modelcontextprotocol.io/",
-                        "https://code.claude.com/docs",
-                        "https://github.com/anthropics/skills"
-                    ],
-                    "search_terms": ["Claude Code best practices", "MCP server development", "Claude skills creation", "Anthropic API usage"]
-                },
-                "web_development": {
-                    "keywords": ["web", "frontend", "backend", "api", "react", "node", "javascript", "typescript", "html", "css"],
-                    "sources": [
-                        "https://developer.mozilla.org/",
-                        "https://web.dev/",
-                        "https://react.dev/",
-                        "https://nodejs.org/docs/",
-                        "https://github.com/airbnb/javascript"
-                    ],
-                    "search_terms": ["web development best practices", "React patterns", "API design", "frontend performance"]
-                },
-                "data_science": {
-                    "keywords": ["data", "analysis", "machine learning", "ml", "ai", "model", "training", "dataset", "pandas", "numpy"],
-                    "sources": [
-                        "https://scikit-learn.org/",
-                        "https://www.kaggle.com/",
-                        "https://pytorch.org/docs/",
-                        "https://www.tensorflow.org/",
-                        "https://pandas.pydata.org/"
-                    ],
-                    "search_terms": ["data science best practices", "ML model training", "data analysis techniques", "feature engineering"]
-                }
-            }
-
             # Detect which domains match
             detected_domains = []
-            for domain, config in domain_patterns.items():
-                # Count keyword matches
-                matches = sum(1 for keyword in config["keywords"] if keyword in combined_text)
-                if matches > 0:
+            for domain, config in DOMAIN_PATTERNS.items():
+                # Substring keyword matches, collected once and counted
+                keywords_matched = [kw for kw in config["keywords"] if kw in combined_text]
+                if keywords_matched:
                     detected_domains.append({
                         "domain": domain,
-                        "match_score": matches,
-                        "sources": config["sources"],
-                        "search_terms": config["search_terms"],
-                        "keywords_matched": [kw for kw in config["keywords"] if kw in combined_text]
+                        "match_score": len(keywords_matched),
+                        "sources": list(config["sources"]),
+                        "search_terms": list(config["search_terms"]),
+                        "keywords_matched": keywords_matched
                     })
 
             # Sort by match score
@@ -5,6 +5,15 @@ Persistent context across all projects and sessions
 """
 import asyncio
 import json
+import mmap
+import os
+import re
+import sqlite3
+import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -13,17 +22,271 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, Prompt, PromptArgument, GetPromptResult, PromptMessage
 
+# Optional: orjson is a much faster JSON codec (see requirements.txt)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Storage location
 MEMORY_DIR = Path.home() / ".claude_memory"
 MEMORY_DIR.mkdir(exist_ok=True)
 
+# Search index file (leading underscore keeps it out of project enumeration)
+INDEX_FILE_NAME = "_search_index.db"
+
+# Max parsed project files kept in memory
+PROJECT_CACHE_SIZE = 256
+
+# Sessions kept per project
+MAX_SESSIONS = 10
+
+# Decisions returned inline by load_project_context (use list_decisions for more)
+RECENT_DECISIONS = 20
+
+# Max threads used to read uncached project files in parallel
+LOAD_WORKERS = 32
+
+# Event logs larger than this are folded back into the project file
+EVENTS_COMPACT_BYTES = 256 * 1024
+
+# Tool responses are compact JSON; set MEMORY_MCP_PRETTY=1 to indent them for debugging
+PRETTY_OUTPUT = os.environ.get("MEMORY_MCP_PRETTY") == "1"
+
+# Errors that mean a project file is unreadable or malformed (skipped, not raised)
+BAD_FILE_ERRORS = (OSError, ValueError, json.JSONDecodeError)
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# (epoch second, ISO string) of the last formatted whole second
+_now_iso_cache = (0, "")
+
+
+def now_iso() -> str:
+    """Current local time as ISO-8601, same as datetime.now().isoformat().
+
+    The date and time up to the second are formatted at most once per
+    second; only the microseconds are appended per call.
+    """
+    global _now_iso_cache
+    second, micro = divmod(time.time_ns() // 1000, 1_000_000)
+    if _now_iso_cache[0] != second:
+        _now_iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    if micro:
+        return f"{_now_iso_cache[1]}.{micro:06d}"
+    return _now_iso_cache[1]
+
+
+def objective_haystack(data: Dict) -> str:
+    """Lowercased serialized objective that search_memory matches against."""
+    objective = data.get("objective")
+    if objective and isinstance(objective, dict):
+        return json_dumps(objective).decode("utf-8").lower()
+    return ""
+
+
+def check_project_record(data: Any):
+    """Raise ValueError unless data has the layout the server reads.
+
+    A well-formed JSON file with the wrong shape is as unreadable as a
+    corrupt one; rejecting it here keeps it out of the cache and index.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("project_id"), str):
+        raise ValueError("project record must be an object with a string project_id")
+    for field, text_keys in (("sessions", ("summary",)), ("decisions", ("decision", "rationale"))):
+        records = data.get(field)
+        if not isinstance(records, list) or not all(
+            isinstance(record, dict) and all(isinstance(record.get(key, ""), str) for key in text_keys)
+            for record in records
+        ):
+            raise ValueError(f"project {field} must be a list of records")
+
+
+def check_event(event: Any):
+    """Raise ValueError unless event is a session/decision log line."""
+    if not isinstance(event, dict) or event.get("type") not in ("session", "decision"):
+        raise ValueError("event must be a session or decision")
+    entry = event.get("entry")
+    if not isinstance(entry, dict) or "timestamp" not in entry \
+            or not all(isinstance(entry.get(key, ""), str) for key in ("summary", "decision", "rationale")):
+        raise ValueError("event entry must be a timestamped record")
+
+
+def project_summary(data: Dict) -> Dict:
+    """The list_projects entry for a project record."""
+    return {
+        "project_id": data["project_id"],
+        "project_path": data.get("project_path", "Unknown"),
+        "last_activity": data.get("updated_at", data.get("created_at", "Unknown")),
+        "session_count": len(data.get("sessions", [])),
+        "has_objective": data.get("objective") is not None
+    }
+
+
+def atomic_write(path: Path, payload: bytes):
+    """Write via temp file + fsync + rename so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class SearchIndex:
+    """SQLite FTS5 index used to narrow search_memory to likely matches.
+
+    One row per project holding its lowercased searchable text, indexed with
+    the trigram tokenizer so any substring of 3+ characters is an index
+    lookup (shorter queries fall back to LIKE over the same table). Each row
+    records the file stamp (mtime/size/inode of the project file, mtime/size
+    of its event log) it was built from, so changes written by other processes are
+    re-indexed on the next search. The per-project JSON files stay the
+    source of truth; the database can be deleted at any time and is rebuilt.
+
+    A plain summaries table, written in the same transaction as each FTS row,
+    holds the project's list_projects entry so listing needs no JSON parses.
+
+    If this SQLite build lacks FTS5/trigram support the index is disabled
+    and search_memory scans every project file instead.
+    """
+
+    def __init__(self, index_file: Path):
+        self.index_file = index_file
+        self.stamps: Dict[str, list] = {}
+        self.db: Optional[sqlite3.Connection] = None
+
+        try:
+            db = sqlite3.connect(str(index_file), timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS projects USING "
+                "fts5(project_id UNINDEXED, stamp UNINDEXED, body, tokenize='trigram')"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries (project_id TEXT PRIMARY KEY, "
+                "project_path TEXT, last_activity TEXT, session_count INTEGER, has_objective INTEGER)"
+            )
+            db.commit()
+            for project_id, stamp in db.execute("SELECT project_id, stamp FROM projects"):
+                self.stamps[project_id] = json_loads(stamp)
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Search index disabled ({index_file}): {e}", file=sys.stderr)
+            return
+        self.db = db
+
+    @property
+    def enabled(self) -> bool:
+        return self.db is not None
+
+    @staticmethod
+    def searchable_text(data: Dict) -> List[str]:
+        """Collect the project fields search_memory matches against."""
+        texts = [session.get("summary", "") for session in data.get("sessions", [])]
+        for decision in data.get("decisions", []):
+            texts.append(decision.get("decision", ""))
+            texts.append(decision.get("rationale", ""))
+        texts.append(objective_haystack(data))
+        return texts
+
+    def update(self, project_id: str, data: Dict, stamp: tuple):
+        """(Re)index one project's searchable text and list_projects summary."""
+        if self.db is None:
+            return
+        body = "\n".join(self.searchable_text(data)).lower()
+        summary = project_summary(data)
+        stamp = list(stamp)
+        with self.db:
+            self.db.execute("DELETE FROM projects WHERE project_id = ?", (project_id,))
+            self.db.execute(
+                "INSERT INTO projects (project_id, stamp, body) VALUES (?, ?, ?)",
+                (project_id, json_dumps(stamp).decode(), body)
+            )
+            self.db.execute(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?)",
+                (project_id, summary["project_path"], summary["last_activity"],
+                 summary["session_count"], summary["has_objective"])
+            )
+        self.stamps[project_id] = stamp
+
+    def remove(self, project_id: str):
+        """Drop a project's row."""
+        if self.db is None or self.stamps.pop(project_id, None) is None:
+            return
+        with self.db:
+            self.db.execute("DELETE FROM projects WHERE project_id = ?", (project_id,))
+            self.db.execute("DELETE FROM summaries WHERE project_id = ?", (project_id,))
+
+    def summaries(self) -> List[Dict]:
+        """All indexed projects' list_projects entries, in one query."""
+        rows = self.db.execute(
+            "SELECT project_id, project_path, last_activity, session_count, has_objective FROM summaries"
+        )
+        return [
+            {
+                "project_id": project_id,
+                "project_path": project_path,
+                "last_activity": last_activity,
+                "session_count": session_count,
+                "has_objective": bool(has_objective)
+            }
+            for project_id, project_path, last_activity, session_count, has_objective in rows
+        ]
+
+    def candidates(self, query: str) -> Optional[List[str]]:
+        """Return project IDs whose text contains query (lowercased), best first.
+
+        Returns None when the index is disabled or the query is empty.
+        """
+        if self.db is None or not query:
+            return None
+        if len(query) >= 3:
+            # Quoted phrase of trigrams == substring match; rank by bm25
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = self.db.execute(
+                "SELECT project_id FROM projects WHERE projects MATCH ? ORDER BY rank",
+                (phrase,)
+            )
+        else:
+            pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            rows = self.db.execute(
+                "SELECT project_id FROM projects WHERE body LIKE ? ESCAPE '\\'",
+                (pattern,)
+            )
+        return [project_id for (project_id,) in rows]
+
 
 class MemoryServer:
     """Universal memory server for persistent context."""
 
     def __init__(self):
         self.server = Server("memory-server")
+        self._index: Optional[SearchIndex] = None
+        # Parsed project files keyed by path -> [stamp, data, lowered fields], LRU order
+        self._project_cache: "OrderedDict[Path, tuple]" = OrderedDict()
+        # Unreadable project files keyed by path -> stamp when they failed
+        self._bad_files: Dict[Path, tuple] = {}
         self.setup_handlers()
 
     def setup_handlers(self):
@@ -101,6 +364,28 @@ class MemoryServer:
                         "required": ["project_path", "decision", "rationale"]
                     }
                 ),
+                Tool(
+                    name="list_decisions",
+                    description="List a project's decisions, oldest first, one page at a time",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "project_path": {
+                                "type": "string",
+                                "description": "Absolute path to project"
+                            },
+                            "offset": {
+                                "type": "integer",
+                                "description": "Number of decisions to skip (default: 0)"
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Max decisions to return (default: 20)"
+                            }
+                        },
+                        "required": ["project_path"]
+                    }
+                ),
                 Tool(
                     name="list_projects",
                     description="List all tracked projects",
@@ -166,6 +451,8 @@ class MemoryServer:
                     result = self.load_project_context(**arguments)
                 elif name == "save_decision":
                     result = self.save_decision(**arguments)
+                elif name == "list_decisions":
+                    result = self.list_decisions(**arguments)
                 elif name == "list_projects":
                     result = self.list_projects()
                 elif name == "search_memory":
@@ -177,9 +464,9 @@ class MemoryServer:
                 else:
                     result = {"error": f"Unknown tool: {name}"}
 
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=json_dumps(result, indent=PRETTY_OUTPUT).decode("utf-8"))]
             except Exception as e:
-                return [TextContent(type="text", text=json.dumps({"error": str(e)}, indent=2))]
+                return [TextContent(type="text", text=json_dumps({"error": str(e)}, indent=PRETTY_OUTPUT).decode("utf-8"))]
 
         @self.server.list_prompts()
         async def list_prompts() -> list[Prompt]:
@@ -242,7 +529,7 @@ class MemoryServer:
                     if "error" not in result:
                         objective = result.get("objective", {})
                         recent_sessions = result.get("recent_sessions", [])
-                        decisions = result.get("decisions", [])
+                        decisions = result.get("recent_decisions", [])
 
                         context_summary = f"""
 **Project Context Loaded**:
@@ -267,7 +554,7 @@ class MemoryServer:
 """
                     else:
                         context_summary = "\n**Note**: No previous context found. This may be a new project.\n"
-                except:
+                except Exception:
                     context_summary = "\n**Note**: Could not load project context.\n"
 
                 prompt_text = f"""You are starting a new session for the project at: {project_path}
@@ -569,6 +856,10 @@ Now call `save_decision` with:
         project_id = self.get_project_id(project_path)
         return MEMORY_DIR / f"{project_id}.json"
 
+    def get_events_file(self, project_file: Path) -> Path:
+        """Get path to a project's append-only session/decision log."""
+        return project_file.with_name(f"{project_file.stem}.events.jsonl")
+
     def load_project_data(self, project_path: str) -> Dict:
         """Load project data from memory."""
         project_file = self.get_project_file(project_path)
@@ -577,7 +868,7 @@ Now call `save_decision` with:
             return {
                 "project_id": self.get_project_id(project_path),
                 "project_path": project_path,
-                "created_at": datetime.now().isoformat(),
+                "created_at": now_iso(),
                 "sessions": [],
                 "decisions": [],
                 "objective": None,
@@ -585,16 +876,301 @@ Now call `save_decision` with:
                 "current_status": "active"
             }
 
-        with open(project_file) as f:
-            return json.load(f)
+        return self._cached_load(project_file)
 
     def save_project_data(self, project_path: str, data: Dict):
-        """Save project data to memory."""
+        """Save project data to memory.
+
+        Writes the full project file and folds in (removes) the event log.
+        data is usually the cached dict, already modified by the caller, so
+        a failed write evicts it rather than serve the unsaved change.
+        """
         project_file = self.get_project_file(project_path)
-        data["updated_at"] = datetime.now().isoformat()
+        data["updated_at"] = now_iso()
 
-        with open(project_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        try:
+            atomic_write(project_file, json_dumps(data, indent=True))
+
+            self.get_events_file(project_file).unlink(missing_ok=True)
+        except Exception:
+            self._cache_evict(project_file)
+            raise
+
+        self._remember(project_file, data)
+
+    def _append_event(self, project_path: str, data: Dict, event_type: str, entry: Dict):
+        """Persist a new session/decision as one appended JSONL line.
+
+        Avoids re-serializing the whole project per call. New projects and
+        logs past EVENTS_COMPACT_BYTES fall back to a full save_project_data.
+        Each event carries the next "event_seq"; a snapshot records the last
+        one it folded in, so replay skips events a snapshot already holds
+        (e.g. after a crash between writing it and removing the log).
+        """
+        seq = data.get("event_seq", 0) + 1
+        data["event_seq"] = seq
+
+        project_file = self.get_project_file(project_path)
+        if not project_file.exists():
+            self.save_project_data(project_path, data)
+            return
+
+        try:
+            with open(self.get_events_file(project_file), 'ab') as f:
+                f.write(json_dumps({"seq": seq, "type": event_type, "entry": entry}) + b"\n")
+        except Exception:
+            self._cache_evict(project_file)
+            raise
+        data["updated_at"] = entry["timestamp"]
+
+        if self._file_stamp(project_file)[-1] > EVENTS_COMPACT_BYTES:
+            self.save_project_data(project_path, data)
+        else:
+            self._remember(project_file, data)
+
+    def _remember(self, project_file: Path, data: Dict):
+        """Prime the cache and search index with data just written to disk."""
+        stamp = self._file_stamp(project_file)
+        self._cache_put(project_file, stamp, data)
+
+        self.get_search_index().update(project_file.stem, data, stamp)
+
+    def _file_stamp(self, project_file: Path) -> tuple:
+        """(mtime_ns, size, inode) of a project file followed by (mtime_ns, size) of its event log.
+
+        The inode catches a same-size file atomically replaced within one
+        mtime tick (every save renames a new file into place).
+        """
+        stat = project_file.stat()
+        try:
+            events_stat = self.get_events_file(project_file).stat()
+            events_stamp = (events_stat.st_mtime_ns, events_stat.st_size)
+        except FileNotFoundError:
+            events_stamp = (0, 0)
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino) + events_stamp
+
+    def _cached_load(self, project_file: Path) -> Dict:
+        """Load a project file, reusing the parsed dict while its stamp is unchanged.
+
+        The returned dict is shared with the cache; callers that modify it
+        must persist the change with save_project_data or _append_event,
+        which evict it if the write fails.
+        """
+        key = self._file_stamp(project_file)
+
+        cached = self._project_cache.get(project_file)
+        if cached is not None and cached[0] == key:
+            self._project_cache.move_to_end(project_file)
+            return cached[1]
+
+        key, data = self._read_project(project_file)
+        self._cache_put(project_file, key, data)
+        return data
+
+    def _read_project(self, project_file: Path) -> tuple:
+        """Read and parse a project file plus its event log (no cache access)."""
+        key = self._file_stamp(project_file)
+        with open(project_file, 'rb') as f:
+            data = json_loads(f.read())
+        check_project_record(data)
+        self._replay_events(project_file, data)
+        return key, data
+
+    def _load_many(self, project_files: Dict[Path, tuple]):
+        """Parse stale project files on a thread pool and add them to the cache.
+
+        Takes project file -> stamp (from _scan_project_files). Overlaps file
+        reads across projects; the cache itself is only touched from the
+        calling thread.
+        """
+        stale = []
+        for project_file, stamp in project_files.items():
+            cached = self._project_cache.get(project_file)
+            if cached is None or cached[0] != stamp:
+                stale.append(project_file)
+        stale = stale[:PROJECT_CACHE_SIZE]
+        if len(stale) < 2:
+            return
+
+        def read(project_file: Path):
+            try:
+                return self._read_project(project_file)
+            except BAD_FILE_ERRORS as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(stale))) as pool:
+            for project_file, loaded in zip(stale, pool.map(read, stale)):
+                if isinstance(loaded, Exception):
+                    self._mark_bad(project_file, loaded)
+                else:
+                    self._cache_put(project_file, *loaded)
+
+    def _mark_bad(self, project_file: Path, error: Exception):
+        """Remember an unreadable project file so scans skip it until it changes.
+
+        Warns on stderr once per file version (stdout carries the MCP protocol).
+        """
+        try:
+            stamp = self._file_stamp(project_file)
+        except OSError:
+            return
+        if self._bad_files.get(project_file) != stamp:
+            self._bad_files[project_file] = stamp
+            print(f"memory-server: skipping unreadable {project_file.name}: {error!r}", file=sys.stderr)
+
+    def _replay_events(self, project_file: Path, data: Dict):
+        """Apply sessions/decisions appended since the last full save.
+
+        Events numbered at or below the snapshot's event_seq are already in
+        it and are skipped.
+        """
+        try:
+            f = open(self.get_events_file(project_file), 'rb')
+        except FileNotFoundError:
+            return
+
+        # Bounded deque evicts old sessions as the log is replayed
+        sessions = deque(data["sessions"], maxlen=MAX_SESSIONS)
+
+        with f:
+            for line in f:
+                try:
+                    event = json_loads(line)
+                except ValueError:
+                    # Blank or torn line from an interrupted append
+                    continue
+                check_event(event)
+                seq = event.get("seq")
+                if seq is not None:
+                    if seq <= data.get("event_seq", 0):
+                        continue
+                    data["event_seq"] = seq
+                entry = event["entry"]
+                if event["type"] == "session":
+                    sessions.append(entry)
+                else:
+                    data["decisions"].append(entry)
+                data["updated_at"] = entry["timestamp"]
+
+        data["sessions"] = list(sessions)
+
+    def _lowered_fields(self, project_file: Path) -> tuple:
+        """Lowercased session summaries, (decision, rationale) pairs, all of
+        them NUL-joined into one string, and the objective haystack.
+
+        Computed once per cached copy of a project, so repeated searches
+        skip re-lowering every string. The joined string lets a search reject
+        a project with a single substring check. Call right after _cached_load.
+        """
+        entry = self._project_cache[project_file]
+        if entry[2] is None:
+            data = entry[1]
+            sessions_lc = [session.get("summary", "").lower() for session in data.get("sessions", [])]
+            decisions_lc = [
+                (decision.get("decision", "").lower(), decision.get("rationale", "").lower())
+                for decision in data.get("decisions", [])
+            ]
+            joined_lc = "\x00".join(chain(sessions_lc, chain.from_iterable(decisions_lc)))
+            entry[2] = (sessions_lc, decisions_lc, joined_lc, objective_haystack(data))
+        return entry[2]
+
+    def _is_cached(self, project_file: Path) -> bool:
+        """Check whether a fresh parsed copy of the file is in the cache."""
+        cached = self._project_cache.get(project_file)
+        return cached is not None and cached[0] == self._file_stamp(project_file)
+
+    def _file_contains(self, path: Path, pattern: "re.Pattern[bytes]") -> bool:
+        """Scan raw file bytes via mmap, without reading or decoding JSON."""
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return False
+
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pattern.search(mm) is not None
+
+    def _cache_put(self, project_file: Path, key: tuple, data: Dict):
+        """Store a parsed project in the LRU cache."""
+        # Lowercased search fields are derived lazily by _lowered_fields
+        self._project_cache[project_file] = [key, data, None]
+        self._project_cache.move_to_end(project_file)
+        if len(self._project_cache) > PROJECT_CACHE_SIZE:
+            self._project_cache.popitem(last=False)
+
+    def _cache_evict(self, project_file: Path):
+        """Drop a project's parsed data so the next load re-reads the files."""
+        self._project_cache.pop(project_file, None)
+
+    def get_search_index(self) -> SearchIndex:
+        """Get the search index for the current storage directory."""
+        index_file = MEMORY_DIR / INDEX_FILE_NAME
+        if self._index is None or self._index.index_file != index_file:
+            self._index = SearchIndex(index_file)
+        return self._index
+
+    def _scan_project_files(self) -> Dict[Path, tuple]:
+        """Map each project file to its stamp in a single os.scandir pass.
+
+        Internal files (leading underscore, e.g. the index) and files known to
+        be unreadable at their current stamp are skipped. Event logs are
+        folded into their project's stamp, so no per-file Path.stat() calls
+        are needed.
+        """
+        project_stats: Dict[str, tuple] = {}
+        events_stats: Dict[str, tuple] = {}
+
+        with os.scandir(MEMORY_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("_"):
+                    continue
+                if name.endswith(".events.jsonl"):
+                    stat = entry.stat()
+                    events_stats[name[:-len(".events.jsonl")]] = (stat.st_mtime_ns, stat.st_size)
+                elif name.endswith(".json"):
+                    stat = entry.stat()
+                    # entry.inode(), not stat.st_ino: DirEntry.stat() reports 0 on
+                    # Windows, which would never match _file_stamp's Path.stat()
+                    project_stats[name[:-len(".json")]] = (stat.st_mtime_ns, stat.st_size, entry.inode())
+
+        project_files = {}
+        for stem, stat in project_stats.items():
+            project_file = MEMORY_DIR / f"{stem}.json"
+            stamp = stat + events_stats.get(stem, (0, 0))
+            if self._bad_files.get(project_file) != stamp:
+                project_files[project_file] = stamp
+        return project_files
+
+    def _refresh_search_index(self) -> SearchIndex:
+        """Re-index project files added, changed, or removed since last indexed."""
+        index = self.get_search_index()
+        if not index.enabled:
+            return index
+        on_disk = set()
+        stale = []
+
+        for project_file, stamp in self._scan_project_files().items():
+            project_id = project_file.stem
+            on_disk.add(project_id)
+            if index.stamps.get(project_id) != list(stamp):
+                stale.append((project_file, stamp))
+
+        # Parse all changed files in parallel, then index them
+        self._load_many(dict(stale))
+        for project_file, stamp in stale:
+            try:
+                index.update(project_file.stem, self._cached_load(project_file), stamp)
+            except BAD_FILE_ERRORS as e:
+                self._mark_bad(project_file, e)
+                index.remove(project_file.stem)
+
+        for project_id in set(index.stamps) - on_disk:
+            index.remove(project_id)
+
+        return index
 
     def save_session_summary(
         self,
@@ -608,7 +1184,7 @@ Now call `save_decision` with:
         data = self.load_project_data(project_path)
 
         session = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "summary": summary,
             "decisions": decisions or [],
             "next_steps": next_steps or [],
@@ -617,11 +1193,11 @@ Now call `save_decision` with:
 
         data["sessions"].append(session)
 
-        # Keep only last 10 sessions
-        if len(data["sessions"]) > 10:
-            data["sessions"] = data["sessions"][-10:]
+        # Keep only last 10 sessions (trimmed in place, no list copy)
+        if len(data["sessions"]) > MAX_SESSIONS:
+            del data["sessions"][:-MAX_SESSIONS]
 
-        self.save_project_data(project_path, data)
+        self._append_event(project_path, data, "session", session)
 
         return {
             "success": True,
@@ -641,7 +1217,8 @@ Now call `save_decision` with:
             "project_path": data["project_path"],
             "objective": data.get("objective"),
             "recent_sessions": recent_sessions,
-            "all_decisions": data["decisions"],
+            "recent_decisions": data["decisions"][-RECENT_DECISIONS:],
+            "decision_count": len(data["decisions"]),
             "current_status": data.get("current_status", "active"),
             "tech_stack": data.get("tech_stack", []),
             "last_updated": data.get("updated_at", data.get("created_at"))
@@ -657,14 +1234,14 @@ Now call `save_decision` with:
         data = self.load_project_data(project_path)
 
         decision_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "decision": decision,
             "rationale": rationale
         }
 
         data["decisions"].append(decision_entry)
 
-        self.save_project_data(project_path, data)
+        self._append_event(project_path, data, "decision", decision_entry)
 
         return {
             "success": True,
@@ -672,23 +1249,29 @@ Now call `save_decision` with:
             "decision_count": len(data["decisions"])
         }
 
+    def list_decisions(self, project_path: str, offset: int = 0, limit: int = RECENT_DECISIONS) -> Dict:
+        """List a page of a project's decisions (oldest first)."""
+        decisions = self.load_project_data(project_path)["decisions"]
+        offset = max(0, offset)
+
+        return {
+            "project_id": self.get_project_id(project_path),
+            "decisions": decisions[offset:offset + max(0, limit)],
+            "offset": offset,
+            "total": len(decisions)
+        }
+
     def list_projects(self) -> Dict:
-        """List all tracked projects."""
-        projects = []
+        """List all tracked projects.
 
-        for project_file in MEMORY_DIR.glob("*.json"):
-            try:
-                with open(project_file) as f:
-                    data = json.load(f)
-                    projects.append({
-                        "project_id": data["project_id"],
-                        "project_path": data.get("project_path", "Unknown"),
-                        "last_activity": data.get("updated_at", data.get("created_at", "Unknown")),
-                        "session_count": len(data.get("sessions", [])),
-                        "has_objective": data.get("objective") is not None
-                    })
-            except Exception:
-                pass
+        Reads the summaries persisted in the search index, which only
+        re-parses project files changed since they were last indexed.
+        """
+        index = self._refresh_search_index()
+        if index.enabled:
+            projects = index.summaries()
+        else:
+            projects = self._scan_project_summaries()
 
         # Sort by last activity
         projects.sort(key=lambda x: x["last_activity"], reverse=True)
@@ -698,61 +1281,105 @@ Now call `save_decision` with:
             "projects": projects
         }
 
+    def _scan_project_summaries(self) -> List[Dict]:
+        """Build list_projects entries from the project files (index disabled)."""
+        projects = []
+
+        project_files = self._scan_project_files()
+        self._load_many(project_files)
+
+        for project_file in project_files:
+            try:
+                projects.append(project_summary(self._cached_load(project_file)))
+            except BAD_FILE_ERRORS as e:
+                self._mark_bad(project_file, e)
+
+        return projects
+
+    def _iter_matches(self, project_file: Path, data: Dict, query_lower: str):
+        """Yield search matches for one cached project, lazily."""
+        sessions_lc, decisions_lc, joined_lc, haystack = self._lowered_fields(project_file)
+
+        # One substring check over every field; walk them only on a hit
+        if query_lower not in joined_lc:
+            sessions_lc = decisions_lc = ()
+
+        # Search in sessions
+        for session, summary_lc in zip(data.get("sessions", []), sessions_lc):
+            if query_lower in summary_lc:
+                yield {
+                    "type": "session",
+                    "timestamp": session.get("timestamp"),
+                    "content": session.get("summary")
+                }
+
+        # Search in decisions
+        for decision, (decision_lc, rationale_lc) in zip(data.get("decisions", []), decisions_lc):
+            if query_lower in decision_lc or query_lower in rationale_lc:
+                yield {
+                    "type": "decision",
+                    "timestamp": decision.get("timestamp"),
+                    "content": f"{decision.get('decision')} - {decision.get('rationale')}"
+                }
+
+        # Search in objective
+        if haystack and query_lower in haystack:
+            yield {
+                "type": "objective",
+                "content": "Objective contains search term"
+            }
+
     def search_memory(self, query: str) -> Dict:
         """Search across all projects."""
+        # Lower/encode once: str form for decoded fields, bytes form for mmap scans
         query_lower = query.lower()
+        query_bytes = query_lower.encode("utf-8")
         results = []
-
-        for project_file in MEMORY_DIR.glob("*.json"):
+        total_results = 0
+
+        # Raw-bytes prefilter for uncached files. Only valid when the query is
+        # stored verbatim in JSON: printable ASCII without quotes/backslashes.
+        prefilter = None
+        if query.isascii() and query.isprintable() and b'"' not in query_bytes and b'\\' not in query_bytes:
+            prefilter = re.compile(re.escape(query_bytes), re.IGNORECASE)
+
+        # Narrow to projects whose indexed tokens can contain the query
+        candidate_ids = self._refresh_search_index().candidates(query_lower)
+        if candidate_ids is None:
+            project_files = list(self._scan_project_files())
+        else:
+            project_files = [MEMORY_DIR / f"{project_id}.json" for project_id in candidate_ids]
+
+        for project_file in project_files:
             try:
-                with open(project_file) as f:
-                    data = json.load(f)
-
-                    matches = []
-
-                    # Search in sessions
-                    for session in data.get("sessions", []):
-                        if query_lower in session.get("summary", "").lower():
-                            matches.append({
-                                "type": "session",
-                                "timestamp": session.get("timestamp"),
-                                "content": session.get("summary")
-                            })
-
-                    # Search in decisions
-                    for decision in data.get("decisions", []):
-                        if query_lower in decision.get("decision", "").lower() or \
-                           query_lower in decision.get("rationale", "").lower():
-                            matches.append({
-                                "type": "decision",
-                                "timestamp": decision.get("timestamp"),
-                                "content": f"{decision.get('decision')} - {decision.get('rationale')}"
-                            })
-
-                    # Search in objective
-                    objective = data.get("objective")
-                    if objective and isinstance(objective, dict):
-                        objective_str = json.dumps(objective).lower()
-                        if query_lower in objective_str:
-                            matches.append({
-                                "type": "objective",
-                                "content": "Objective contains search term"
-                            })
-
-                    if matches:
+                if prefilter is not None and not self._is_cached(project_file) \
+                        and not self._file_contains(project_file, prefilter) \
+                        and not self._file_contains(self.get_events_file(project_file), prefilter):
+                    continue
+
+                data = self._cached_load(project_file)
+                matches = self._iter_matches(project_file, data, query_lower)
+
+                if len(results) < 10:  # Limit to 10 projects
+                    found = list(islice(matches, 5))  # Limit to 5 per project
+                    if found:
                         results.append({
                             "project_id": data["project_id"],
                             "project_path": data.get("project_path"),
-                            "matches": matches[:5]  # Limit to 5 per project
+                            "matches": found
                         })
+                        total_results += 1
+                elif next(matches, None) is not None:
+                    # Past the result cap only the count is needed
+                    total_results += 1
 
-            except Exception:
-                pass
+            except BAD_FILE_ERRORS as e:
+                self._mark_bad(project_file, e)
 
         return {
             "query": query,
-            "total_results": len(results),
-            "results": results[:10]  # Limit to 10 projects
+            "total_results": total_results,
+            "results": results
         }
 
     def save_project_objective(
@@ -798,6 +1425,9 @@ Now call `save_decision` with:
 
 async def main():
     """Main entry point."""
+    if orjson is None:
+        # stderr only: stdout carries the MCP protocol
+        print("memory-server: orjson not installed; using slower stdlib json", file=sys.stderr)
     server = MemoryServer()
     await server.run()
 
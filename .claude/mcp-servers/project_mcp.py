@@ -4,9 +4,16 @@ Project Manager MCP Server
 Objective-driven task management with best-practice enforcement
 """
 import asyncio
+import heapq
 import json
+import os
 import re
+import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -14,6 +21,52 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, Prompt, PromptArgument, GetPromptResult, PromptMessage
 
+# Optional: orjson is a much faster JSON codec (see requirements.txt)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Max projects whose parsed data (and last written plan) are kept in memory
+PROJECT_CACHE_SIZE = 32
+
+# Journals larger than this are folded back into project_data.json
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+# Completed tasks kept in project data; older ones move to the archive log
+RECENT_COMPLETED_TASKS = 10
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def atomic_write(path: Path, payload: bytes):
+    """Write via temp file + fsync + rename so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 # Vague answer patterns
 VAGUE_PATTERNS = {
@@ -29,6 +82,55 @@ VAGUE_PATTERNS = {
     "organize": "Organize what exactly? How is it currently disorganized?"
 }
 
+# Any vague term anywhere in a (lowercased) short answer, in one pass
+VAGUE_TERM_PATTERN = re.compile('|'.join(re.escape(term) for term in VAGUE_PATTERNS))
+
+# Vague terms appearing as whole whitespace-separated words in a long answer
+VAGUE_WORD_PATTERN = re.compile(
+    r'(?<!\S)(' + '|'.join(re.escape(term) for term in VAGUE_PATTERNS) + r')(?!\S)'
+)
+
+# Objective category, prefix of the answer ids filed under it, and its
+# key in the objective summary
+ANSWER_CATEGORIES = (
+    ("problem_definition", "problem_", "problem"),
+    ("target_user", "target_user", "target_user"),
+    ("solution", "solution_", "solution"),
+    ("success_metrics", "success_metrics", "success_metrics"),
+    ("constraints", "constraints", "constraints")
+)
+
+# Stem of generated answer ids ("problem_1", "target_user_2_followup") -> category
+ANSWER_ID_STEMS = {
+    "problem": "problem_definition",
+    "problem_definition": "problem_definition",
+    "target_user": "target_user",
+    "solution": "solution",
+    "success_metrics": "success_metrics",
+    "constraints": "constraints"
+}
+
+# Phrases showing a long answer backs its vague words with specifics
+SPECIFIC_INDICATORS = ('for example', 'such as', 'specifically', 'including')
+
+# Connecting words that suggest a task bundles several actions (whole words only)
+ACTION_WORD_PATTERN = re.compile(r'\b(?:and|then|after|also|plus)\b', re.IGNORECASE)
+
+# Objective keywords: runs of 5+ word characters, so punctuation never sticks to a word
+KEYWORD_PATTERN = re.compile(r'\w{5,}')
+
+# Patterns used when judging answers (compiled once, reused per answer)
+DIGIT_PATTERN = re.compile(r'\d')
+PROPER_NOUN_PATTERN = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+')
+
+# Other vague wording in short answers -> follow-up question
+VAGUE_INDICATORS = [
+    (re.compile(r'\b(someone|anyone|everyone)\b'), "Who specifically? Give examples."),
+    (re.compile(r'\b(something|anything|everything)\b'), "What specifically?"),
+    (re.compile(r'\b(somewhere|anywhere|everywhere)\b'), "Where specifically?"),
+    (re.compile(r'\b(somehow|anyhow)\b'), "How specifically?")
+]
+
 # Question framework
 QUESTION_FRAMEWORK = {
     "problem_definition": [
@@ -64,213 +166,329 @@ QUESTION_FRAMEWORK = {
     ]
 }
 
+# Categories in the order they are asked, each with its (question id, question) pairs
+QUESTION_SEQUENCE = tuple(
+    (category, tuple((f"{category}_{n}", question) for n, question in enumerate(questions, 1)))
+    for category, questions in QUESTION_FRAMEWORK.items()
+)
+
+
+@lru_cache(maxsize=1024)
+def detect_vague_answer(answer: str) -> Tuple[bool, Optional[str]]:
+    """Vague-language verdict for an answer: (is_vague, follow_up_question).
+
+    Depends only on the answer text, so verdicts are memoized (the same
+    answer is often resubmitted while refining an objective).
+    """
+    answer_lower = answer.lower()
+
+    # Only check if answer is very short (likely genuinely vague)
+    # Longer answers with context are likely specific enough
+    if len(answer) > 100:
+        # For longer answers, only check for standalone vague terms
+        # Don't trigger if the word appears in a detailed context
+        match = VAGUE_WORD_PATTERN.search(answer_lower)
+        if match:
+            # Check if it's in a sentence with specific details (numbers, proper nouns, etc).
+            # Cheapest checks first; stops at the first one that holds.
+            has_specifics = (
+                len(answer) > 200  # Very detailed answer
+                or any(indicator in answer_lower for indicator in SPECIFIC_INDICATORS)
+                or DIGIT_PATTERN.search(answer) is not None  # Contains numbers
+                or PROPER_NOUN_PATTERN.search(answer) is not None  # Proper nouns
+            )
+
+            if not has_specifics:
+                # Genuinely vague
+                return True, VAGUE_PATTERNS[match.group(1)]
+
+        # Long answer with no vague standalone words (or with enough context)
+        return False, None
+
+    # For short answers, check for vague patterns
+    match = VAGUE_TERM_PATTERN.search(answer_lower)
+    if match:
+        return True, VAGUE_PATTERNS[match.group(0)]
+
+    # Check for other vague patterns
+    for pattern, follow_up in VAGUE_INDICATORS:
+        if pattern.search(answer_lower):
+            return True, follow_up
+
+    return False, None
+
+
+@lru_cache(maxsize=64)
+def objective_keywords(text: str) -> Tuple[Tuple[str, int], ...]:
+    """Distinct lowercased words of an objective field (>4 chars) with repeat counts.
+
+    Words are split on punctuation as well as whitespace ("dashboard," yields
+    "dashboard"). Each occurrence of a word found in a task scores, so counts are kept
+    while the substring test runs once per distinct word. Cached so scoring
+    many tasks against one objective splits its text only once.
+    """
+    counts: Dict[str, int] = {}
+    for word in KEYWORD_PATTERN.findall(text.lower()):
+        counts[word] = counts.get(word, 0) + 1
+    return tuple(counts.items())
+
+
+def keyword_matches(keywords: Tuple[Tuple[str, int], ...], task_lower: str, limit: int) -> int:
+    """Count keyword occurrences found in task_lower, stopping once limit is reached."""
+    matches = 0
+    for word, count in keywords:
+        if word in task_lower:
+            matches += count
+            if matches >= limit:
+                return limit
+    return matches
+
+
+@lru_cache(maxsize=1024)
+def task_alignment_score(task_description: str, problem: str, solution: str) -> int:
+    """Score (0-100) how well a task relates to the objective's problem and solution.
+
+    Keyed on the only objective fields that affect the score, so a redefined
+    objective never hits a stale entry. Scope-creep audits and priority
+    challenges rescore the same tasks against the same objective repeatedly.
+    """
+    score = 50  # Base score
+
+    task_lower = task_description.lower()
+
+    # Check if task relates to problem (10 per match, max 30)
+    score += keyword_matches(objective_keywords(problem), task_lower, 3) * 10
+
+    # Check if task relates to solution (10 per match, max 20)
+    score += keyword_matches(objective_keywords(solution), task_lower, 2) * 10
+
+    return min(score, 100)
+
 
 class ProjectServer:
     """Project manager server with objective-driven focus."""
 
+    __slots__ = (
+        "server",
+        "_project_cache",
+        "_cache_lock",
+        "_project_locks",
+        "_plan_cache",
+        "_tools",
+        "_dispatch"
+    )
+
     def __init__(self):
         self.server = Server("project-server")
+        # data path -> (stamp from _data_stamp, parsed data), least recently used first
+        self._project_cache: "OrderedDict[Path, Tuple[tuple, Dict]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # data path -> [lock serializing tool calls on that project, calls holding
+        # or waiting on it]; entries are dropped once no call uses them
+        self._project_locks: Dict[Path, list] = {}
+        # plan path -> ((mtime_ns, size, inode) after our last write, plan body written),
+        # least recently used first
+        self._plan_cache: "OrderedDict[Path, Tuple[tuple, str]]" = OrderedDict()
         self.setup_handlers()
 
     def setup_handlers(self):
         """Setup MCP tool handlers."""
 
+        # Tool descriptors never change: build them once, not per listing
+        self._tools = [
+            # Objective clarification tools
+            Tool(
+                name="clarify_project_objective",
+                description="Start comprehensive objective clarification interrogation",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"},
+                        "initial_description": {"type": "string"}
+                    },
+                    "required": ["project_path", "initial_description"]
+                }
+            ),
+            Tool(
+                name="answer_objective_question",
+                description="Answer objective clarification question",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"},
+                        "question_id": {"type": "string"},
+                        "answer": {"type": "string"}
+                    },
+                    "required": ["project_path", "question_id", "answer"]
+                }
+            ),
+            Tool(
+                name="score_objective_clarity",
+                description="Score objective clarity (0-100)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"}
+                    },
+                    "required": ["project_path"]
+                }
+            ),
+            Tool(
+                name="define_project_objective",
+                description="Finalize and store project objective",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"}
+                    },
+                    "required": ["project_path"]
+                }
+            ),
+
+            # Task management tools
+            Tool(
+                name="create_task_breakdown",
+                description="Break project into small, objective-aligned tasks",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"}
+                    },
+                    "required": ["project_path"]
+                }
+            ),
+            Tool(
+                name="validate_task_alignment",
+                description="Check if task serves objective",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"},
+                        "task_description": {"type": "string"}
+                    },
+                    "required": ["project_path", "task_description"]
+                }
+            ),
+            Tool(
+                name="challenge_task_priority",
+                description="Challenge if task is highest priority",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"},
+                        "task_id": {"type": "string"}
+                    },
+                    "required": ["project_path", "task_id"]
+                }
+            ),
+            Tool(
+                name="validate_task_size",
+                description="Check if task is small enough",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "task_description": {"type": "string"}
+                    },
+                    "required": ["task_description"]
+                }
+            ),
+            Tool(
+                name="mark_task_complete",
+                description="Mark task complete (requires quality gate PASS)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"},
+                        "task_id": {"type": "string"},
+                        "quality_gate_passed": {"type": "boolean"}
+                    },
+                    "required": ["project_path", "task_id", "quality_gate_passed"]
+                }
+            ),
+            Tool(
+                name="get_current_status",
+                description="Get current project status",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"}
+                    },
+                    "required": ["project_path"]
+                }
+            ),
+            Tool(
+                name="identify_scope_creep",
+                description="Find tasks that don't serve objective",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"}
+                    },
+                    "required": ["project_path"]
+                }
+            ),
+            Tool(
+                name="refocus_on_objective",
+                description="Review all tasks against objective, cut non-essential",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"}
+                    },
+                    "required": ["project_path"]
+                }
+            ),
+            Tool(
+                name="sync_plan_to_reality",
+                description="Update plan to match actual project state",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {"type": "string"}
+                    },
+                    "required": ["project_path"]
+                }
+            )
+        ]
+
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            return [
-                # Objective clarification tools
-                Tool(
-                    name="clarify_project_objective",
-                    description="Start comprehensive objective clarification interrogation",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"},
-                            "initial_description": {"type": "string"}
-                        },
-                        "required": ["project_path", "initial_description"]
-                    }
-                ),
-                Tool(
-                    name="answer_objective_question",
-                    description="Answer objective clarification question",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"},
-                            "question_id": {"type": "string"},
-                            "answer": {"type": "string"}
-                        },
-                        "required": ["project_path", "question_id", "answer"]
-                    }
-                ),
-                Tool(
-                    name="score_objective_clarity",
-                    description="Score objective clarity (0-100)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"}
-                        },
-                        "required": ["project_path"]
-                    }
-                ),
-                Tool(
-                    name="define_project_objective",
-                    description="Finalize and store project objective",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"}
-                        },
-                        "required": ["project_path"]
-                    }
-                ),
-
-                # Task management tools
-                Tool(
-                    name="create_task_breakdown",
-                    description="Break project into small, objective-aligned tasks",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"}
-                        },
-                        "required": ["project_path"]
-                    }
-                ),
-                Tool(
-                    name="validate_task_alignment",
-                    description="Check if task serves objective",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"},
-                            "task_description": {"type": "string"}
-                        },
-                        "required": ["project_path", "task_description"]
-                    }
-                ),
-                Tool(
-                    name="challenge_task_priority",
-                    description="Challenge if task is highest priority",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"},
-                            "task_id": {"type": "string"}
-                        },
-                        "required": ["project_path", "task_id"]
-                    }
-                ),
-                Tool(
-                    name="validate_task_size",
-                    description="Check if task is small enough",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "task_description": {"type": "string"}
-                        },
-                        "required": ["task_description"]
-                    }
-                ),
-                Tool(
-                    name="mark_task_complete",
-                    description="Mark task complete (requires quality gate PASS)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"},
-                            "task_id": {"type": "string"},
-                            "quality_gate_passed": {"type": "boolean"}
-                        },
-                        "required": ["project_path", "task_id", "quality_gate_passed"]
-                    }
-                ),
-                Tool(
-                    name="get_current_status",
-                    description="Get current project status",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"}
-                        },
-                        "required": ["project_path"]
-                    }
-                ),
-                Tool(
-                    name="identify_scope_creep",
-                    description="Find tasks that don't serve objective",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"}
-                        },
-                        "required": ["project_path"]
-                    }
-                ),
-                Tool(
-                    name="refocus_on_objective",
-                    description="Review all tasks against objective, cut non-essential",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"}
-                        },
-                        "required": ["project_path"]
-                    }
-                ),
-                Tool(
-                    name="sync_plan_to_reality",
-                    description="Update plan to match actual project state",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string"}
-                        },
-                        "required": ["project_path"]
-                    }
-                )
-            ]
+            return self._tools
+
+        # Tool name -> handler, built once so each call is a single lookup
+        self._dispatch = {
+            # Objective clarification
+            "clarify_project_objective": self.clarify_project_objective,
+            "answer_objective_question": self.answer_objective_question,
+            "score_objective_clarity": self.score_objective_clarity,
+            "define_project_objective": self.define_project_objective,
+
+            # Task management
+            "create_task_breakdown": self.create_task_breakdown,
+            "validate_task_alignment": self.validate_task_alignment,
+            "challenge_task_priority": self.challenge_task_priority,
+            "validate_task_size": self.validate_task_size,
+            "mark_task_complete": self.mark_task_complete,
+            "get_current_status": self.get_current_status,
+            "identify_scope_creep": self.identify_scope_creep,
+            "refocus_on_objective": self.refocus_on_objective,
+            "sync_plan_to_reality": self.sync_plan_to_reality
+        }
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             try:
-                # Objective clarification
-                if name == "clarify_project_objective":
-                    result = self.clarify_project_objective(**arguments)
-                elif name == "answer_objective_question":
-                    result = self.answer_objective_question(**arguments)
-                elif name == "score_objective_clarity":
-                    result = self.score_objective_clarity(**arguments)
-                elif name == "define_project_objective":
-                    result = self.define_project_objective(**arguments)
-
-                # Task management
-                elif name == "create_task_breakdown":
-                    result = self.create_task_breakdown(**arguments)
-                elif name == "validate_task_alignment":
-                    result = self.validate_task_alignment(**arguments)
-                elif name == "challenge_task_priority":
-                    result = self.challenge_task_priority(**arguments)
-                elif name == "validate_task_size":
-                    result = self.validate_task_size(**arguments)
-                elif name == "mark_task_complete":
-                    result = self.mark_task_complete(**arguments)
-                elif name == "get_current_status":
-                    result = self.get_current_status(**arguments)
-                elif name == "identify_scope_creep":
-                    result = self.identify_scope_creep(**arguments)
-                elif name == "refocus_on_objective":
-                    result = self.refocus_on_objective(**arguments)
-                elif name == "sync_plan_to_reality":
-                    result = self.sync_plan_to_reality(**arguments)
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     result = {"error": f"Unknown tool: {name}"}
+                else:
+                    # File I/O and JSON work run on a worker thread so the
+                    # event loop keeps serving other calls meanwhile
+                    result = await asyncio.to_thread(self._run_tool, handler, arguments)
 
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=json_dumps(result, indent=True).decode("utf-8"))]
             except Exception as e:
-                return [TextContent(type="text", text=json.dumps({"error": str(e)}, indent=2))]
+                return [TextContent(type="text", text=json_dumps({"error": str(e)}, indent=True).decode("utf-8"))]
 
         @self.server.list_prompts()
         async def list_prompts() -> list[Prompt]:
@@ -689,15 +907,94 @@ For each sub-task, call:
             else:
                 raise ValueError(f"Unknown prompt: {name}")
 
-    def _get_project_data_path(self, project_path: str) -> Path:
-        """Get path to project data file."""
+    def _run_tool(self, handler, arguments: Dict) -> Dict:
+        """Run a tool handler, one call at a time per project.
+
+        Tools load, modify and save a project's data; calls on different
+        projects run concurrently, calls on the same project never overlap.
+        Handlers modify the cached data in place, so a call that raises
+        evicts it: a change made but never saved must not outlive the call.
+        """
+        project_path = arguments.get("project_path")
+        if project_path is None:
+            return handler(**arguments)
+
+        # Keyed like the data cache, so every spelling of a path shares a lock
+        data_path = self._get_project_data_path(project_path)
+        with self._cache_lock:
+            entry = self._project_locks.get(data_path)
+            if entry is None:
+                entry = self._project_locks[data_path] = [threading.Lock(), 0]
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                try:
+                    return handler(**arguments)
+                except Exception:
+                    self._cache_evict(data_path)
+                    raise
+        finally:
+            with self._cache_lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._project_locks[data_path]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_project_data_path(project_path: str) -> Path:
+        """Get path to project data file (built once per project path)."""
         return Path(project_path) / ".project_manager" / "project_data.json"
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_plan_path(project_path: str) -> Path:
+        """Get path to PROJECT_PLAN.md (built once per project path)."""
+        return Path(project_path) / "docs" / "notes" / "PROJECT_PLAN.md"
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_completion_log_path(project_path: str) -> Path:
+        """Get path to the completed-actions log (built once per project path)."""
+        return Path(project_path) / "artifacts" / "logs" / "completed-actions.log"
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_completed_archive_path(project_path: str) -> Path:
+        """Get path to the archive of older completed tasks (built once per project path)."""
+        return Path(project_path) / "artifacts" / "logs" / "completed-archive.jsonl"
+
+    def _get_journal_path(self, data_path: Path) -> Path:
+        """Get path to the append-only change journal of a project data file."""
+        return data_path.with_name("project_data.log")
+
+    def _data_stamp(self, data_path: Path) -> tuple:
+        """(mtime_ns, size, inode) of a project data file followed by (mtime_ns, size) of its journal.
+
+        The inode catches a same-size snapshot atomically replaced within one
+        mtime tick (every save renames a new file into place).
+        """
+        st = data_path.stat()
+        try:
+            journal_st = self._get_journal_path(data_path).stat()
+            journal_stamp = (journal_st.st_mtime_ns, journal_st.st_size)
+        except FileNotFoundError:
+            journal_stamp = (0, 0)
+        return (st.st_mtime_ns, st.st_size, st.st_ino) + journal_stamp
+
     def _load_project_data(self, project_path: str) -> Dict:
-        """Load project data."""
+        """Load project data (snapshot plus any journaled changes).
+
+        Parsed data is cached per file and reused while the mtime and size of
+        the file and its journal are unchanged. The cached dict is returned
+        as-is: callers that modify it must save it with _save_project_data
+        (or _append_journal); _run_tool evicts it if the call fails first.
+        """
         data_path = self._get_project_data_path(project_path)
 
-        if not data_path.exists():
+        try:
+            stamp = self._data_stamp(data_path)
+        except FileNotFoundError:
             return {
                 "objective": None,
                 "objective_clarification": {
@@ -711,16 +1008,128 @@ For each sub-task, call:
                 "audits": []
             }
 
-        with open(data_path) as f:
-            return json.load(f)
+        with self._cache_lock:
+            cached = self._project_cache.get(data_path)
+            if cached is not None and cached[0] == stamp:
+                self._project_cache.move_to_end(data_path)
+                return cached[1]
+
+        with open(data_path, 'rb') as f:
+            data = json_loads(f.read())
+        self._replay_journal(data_path, data)
+        self._cache_put(data_path, stamp, data)
+        return data
 
     def _save_project_data(self, project_path: str, data: Dict):
-        """Save project data."""
+        """Save project data.
+
+        Writes the full snapshot and folds in (removes) the journal.
+        """
         data_path = self._get_project_data_path(project_path)
         data_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(data_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        atomic_write(data_path, json_dumps(data, indent=True))
+        self._get_journal_path(data_path).unlink(missing_ok=True)
+
+        # Cache what was just written so the next load skips the parse
+        self._cache_put(data_path, self._data_stamp(data_path), data)
+
+    def _append_journal(self, project_path: str, data: Dict, entries: List[Dict]):
+        """Persist changes already applied to data as appended journal lines.
+
+        Avoids re-serializing the whole project for small changes. Projects
+        without a snapshot yet and journals past JOURNAL_COMPACT_BYTES fall
+        back to a full _save_project_data. Entries are numbered from the
+        data's "journal_seq"; a snapshot records the last one it folded in,
+        so replay skips entries it already holds (e.g. after a crash between
+        writing it and removing the journal).
+        """
+        seq = data.get("journal_seq", 0)
+        numbered = []
+        for entry in entries:
+            seq += 1
+            numbered.append({"seq": seq, **entry})
+        data["journal_seq"] = seq
+
+        data_path = self._get_project_data_path(project_path)
+        if not data_path.exists():
+            self._save_project_data(project_path, data)
+            return
+
+        payload = b"".join(json_dumps(entry) + b"\n" for entry in numbered)
+        with open(self._get_journal_path(data_path), 'ab') as f:
+            f.write(payload)
+
+        stamp = self._data_stamp(data_path)
+        if stamp[-1] > JOURNAL_COMPACT_BYTES:
+            self._save_project_data(project_path, data)
+        else:
+            self._cache_put(data_path, stamp, data)
+
+    def _replay_journal(self, data_path: Path, data: Dict):
+        """Apply changes journaled since the last full save.
+
+        Entries numbered at or below the snapshot's journal_seq are already
+        in it and are skipped.
+        """
+        try:
+            f = open(self._get_journal_path(data_path), 'rb')
+        except FileNotFoundError:
+            return
+
+        with f:
+            for line in f:
+                try:
+                    entry = json_loads(line)
+                except ValueError:
+                    # Blank or torn line from an interrupted append
+                    continue
+                seq = entry.get("seq")
+                if seq is not None:
+                    if seq <= data.get("journal_seq", 0):
+                        continue
+                    data["journal_seq"] = seq
+                self._apply_clarification_change(data["objective_clarification"], entry)
+
+    def _apply_clarification_change(self, clarification: Dict, change: Dict):
+        """Apply one journaled clarification change.
+
+        answer_objective_question makes its changes through here too, so live
+        updates and journal replay cannot drift apart.
+        """
+        op = change["op"]
+        if op == "answer":
+            question_id = change["question_id"]
+            self._record_answer(clarification, question_id, change["answer"])
+
+            # Mark question as answered
+            position = self._question_index(clarification).get(question_id)
+            if position is not None:
+                q = clarification["questions"][position]
+                q["answered"] = True
+                category = q.get("category")
+                if category != "follow_up" and category not in clarification["answered_categories"]:
+                    clarification["answered_categories"].append(category)
+        elif op == "ask":
+            self._add_question(clarification, change["question"])
+            clarification["current_question_id"] = change["question"]["id"]
+        elif op == "status":
+            clarification["status"] = change["status"]
+            if "completed_at" in change:
+                clarification["completed_at"] = change["completed_at"]
+
+    def _cache_put(self, data_path: Path, stamp: tuple, data: Dict):
+        """Store parsed project data in the LRU cache."""
+        with self._cache_lock:
+            self._project_cache[data_path] = (stamp, data)
+            self._project_cache.move_to_end(data_path)
+            if len(self._project_cache) > PROJECT_CACHE_SIZE:
+                self._project_cache.popitem(last=False)
+
+    def _cache_evict(self, data_path: Path):
+        """Drop a project's parsed data so the next load re-reads the files."""
+        with self._cache_lock:
+            self._project_cache.pop(data_path, None)
 
     def clarify_project_objective(
         self,
@@ -737,7 +1146,11 @@ For each sub-task, call:
             "started_at": datetime.now().isoformat(),
             "questions": [],
             "answers": {},
-            "current_question_id": None
+            "current_question_id": None,
+            # Lookup aggregates over "questions", maintained by _add_question
+            "question_index": {},
+            "category_counts": {},
+            "answered_categories": []
         }
 
         # Generate first question
@@ -748,7 +1161,7 @@ For each sub-task, call:
             "answered": False
         }
 
-        data["objective_clarification"]["questions"].append(first_question)
+        self._add_question(data["objective_clarification"], first_question)
         data["objective_clarification"]["current_question_id"] = "problem_1"
 
         self._save_project_data(project_path, data)
@@ -772,18 +1185,21 @@ For each sub-task, call:
         """Answer objective clarification question."""
         data = self._load_project_data(project_path)
         clarification = data["objective_clarification"]
+        now_iso = datetime.now().isoformat()
 
-        # Store answer
-        clarification["answers"][question_id] = {
-            "answer": answer,
-            "timestamp": datetime.now().isoformat()
-        }
+        # Changes are applied in memory and journaled, not written as a full save
+        changes = []
 
-        # Mark question as answered
-        for q in clarification["questions"]:
-            if q["id"] == question_id:
-                q["answered"] = True
-                break
+        def apply(change: Dict):
+            self._apply_clarification_change(clarification, change)
+            changes.append(change)
+
+        # Store answer and mark question as answered
+        apply({
+            "op": "answer",
+            "question_id": question_id,
+            "answer": {"answer": answer, "timestamp": now_iso}
+        })
 
         # Check if answer is vague
         is_vague, follow_up = self._detect_vague_answer(answer, question_id)
@@ -791,18 +1207,18 @@ For each sub-task, call:
         if is_vague:
             # Generate follow-up question
             follow_up_id = f"{question_id}_followup"
-            follow_up_question = {
-                "id": follow_up_id,
-                "category": "follow_up",
-                "question": follow_up,
-                "parent_question": question_id,
-                "answered": False
-            }
+            apply({
+                "op": "ask",
+                "question": {
+                    "id": follow_up_id,
+                    "category": "follow_up",
+                    "question": follow_up,
+                    "parent_question": question_id,
+                    "answered": False
+                }
+            })
 
-            clarification["questions"].append(follow_up_question)
-            clarification["current_question_id"] = follow_up_id
-
-            self._save_project_data(project_path, data)
+            self._append_journal(project_path, data, changes)
 
             return {
                 "status": "needs_clarification",
@@ -817,10 +1233,9 @@ For each sub-task, call:
         next_question = self._generate_next_question(clarification)
 
         if next_question:
-            clarification["questions"].append(next_question)
-            clarification["current_question_id"] = next_question["id"]
+            apply({"op": "ask", "question": next_question})
 
-            self._save_project_data(project_path, data)
+            self._append_journal(project_path, data, changes)
 
             return {
                 "status": "continue",
@@ -832,30 +1247,29 @@ For each sub-task, call:
             }
         else:
             # All questions answered
-            score = self._calculate_clarity_score(clarification["answers"])
+            score = self._calculate_clarity_score(clarification)
 
             if score >= 80:
-                clarification["status"] = "completed"
-                clarification["completed_at"] = datetime.now().isoformat()
+                apply({"op": "status", "status": "completed", "completed_at": now_iso})
 
-                self._save_project_data(project_path, data)
+                self._append_journal(project_path, data, changes)
 
                 return {
                     "status": "completed",
                     "message": "Objective clarification complete!",
                     "clarity_score": score,
-                    "summary": self._generate_objective_summary(clarification["answers"])
+                    "summary": self._generate_objective_summary(clarification)
                 }
             else:
                 # Score too low, need more questions
-                clarification["status"] = "needs_improvement"
-                self._save_project_data(project_path, data)
+                apply({"op": "status", "status": "needs_improvement"})
+                self._append_journal(project_path, data, changes)
 
                 return {
                     "status": "needs_improvement",
                     "clarity_score": score,
                     "message": f"Clarity score is {score}/100. Need ≥80. Let's clarify further.",
-                    "weak_areas": self._identify_weak_areas(clarification["answers"])
+                    "weak_areas": self._identify_weak_areas(clarification)
                 }
 
     def _detect_vague_answer(self, answer: str, question_id: Optional[str] = None) -> Tuple[bool, Optional[str]]:
@@ -873,193 +1287,181 @@ For each sub-task, call:
             # Accept any answer to a followup question - no infinite loops!
             return False, None
 
-        answer_lower = answer.lower()
-
-        # Only check if answer is very short (likely genuinely vague)
-        # Longer answers with context are likely specific enough
-        if len(answer) > 100:
-            # For longer answers, only check for standalone vague terms
-            # Don't trigger if the word appears in a detailed context
-            # Added "manage" and "track" to prevent loops on detailed management descriptions
-            vague_words_standalone = ['people', 'users', 'better', 'faster', 'easier', 'improve', 'help', 'manage', 'track', 'organize']
-            words = answer_lower.split()
-
-            # Check if vague words appear multiple times without much context
-            for vague_word in vague_words_standalone:
-                if vague_word in words:
-                    # Check if it's in a sentence with specific details (numbers, proper nouns, etc)
-                    has_specifics = any([
-                        bool(re.search(r'\d+', answer)),  # Contains numbers
-                        bool(re.search(r'[A-Z][a-z]+\s+[A-Z][a-z]+', answer)),  # Proper nouns
-                        len(answer) > 200,  # Very detailed answer
-                        any(indicator in answer_lower for indicator in ['for example', 'such as', 'specifically', 'including'])
-                    ])
-
-                    if has_specifics:
-                        # Answer has context, don't mark as vague
-                        continue
-                    else:
-                        # Genuinely vague
-                        follow_up = VAGUE_PATTERNS.get(vague_word, "Can you be more specific?")
-                        return True, follow_up
+        return detect_vague_answer(answer)
 
-            # Long answer with no vague standalone words
-            return False, None
-
-        # For short answers, check for vague patterns
-        for vague_term, follow_up in VAGUE_PATTERNS.items():
-            if vague_term in answer_lower:
-                return True, follow_up
-
-        # Check for other vague patterns
-        vague_indicators = [
-            (r'\b(someone|anyone|everyone)\b', "Who specifically? Give examples."),
-            (r'\b(something|anything|everything)\b', "What specifically?"),
-            (r'\b(somewhere|anywhere|everywhere)\b', "Where specifically?"),
-            (r'\b(somehow|anyhow)\b', "How specifically?")
-        ]
+    def _question_index(self, clarification: Dict) -> Dict[str, int]:
+        """Get the question id -> position index of a clarification session.
 
-        for pattern, follow_up in vague_indicators:
-            if re.search(pattern, answer_lower):
-                return True, follow_up
-
-        return False, None
+        Sessions saved before the index existed get it (and the per-category
+        aggregates) rebuilt from the question list once.
+        """
+        if "question_index" not in clarification:
+            clarification["question_index"] = {}
+            clarification["category_counts"] = {}
+            clarification["answered_categories"] = []
+            questions = clarification.get("questions", [])
+            clarification["questions"] = []
+            for q in questions:
+                self._add_question(clarification, q)
+                category = q.get("category")
+                if q.get("answered") and category != "follow_up" \
+                        and category not in clarification["answered_categories"]:
+                    clarification["answered_categories"].append(category)
+        return clarification["question_index"]
+
+    def _add_question(self, clarification: Dict, question: Dict):
+        """Append a question and update the lookup aggregates."""
+        self._question_index(clarification)
+        # First question with a given id wins, matching a front-to-back scan
+        clarification["question_index"].setdefault(question["id"], len(clarification["questions"]))
+        counts = clarification["category_counts"]
+        counts[question.get("category")] = counts.get(question.get("category"), 0) + 1
+        clarification["questions"].append(question)
 
     def _generate_next_question(self, clarification: Dict) -> Optional[Dict]:
         """Generate next question based on answered questions."""
-        answered_categories = set()
-
-        for q in clarification["questions"]:
-            if q.get("answered") and q.get("category") != "follow_up":
-                answered_categories.add(q["category"])
-
-        # Determine next category
-        category_order = [
-            "problem_definition",
-            "target_user",
-            "solution",
-            "success_metrics",
-            "constraints"
-        ]
+        self._question_index(clarification)
+        answered_categories = clarification["answered_categories"]
+        category_counts = clarification["category_counts"]
 
-        for category in category_order:
+        # First unanswered category that still has questions left
+        for category, questions in QUESTION_SEQUENCE:
             if category not in answered_categories:
-                # Get questions for this category
-                questions = QUESTION_FRAMEWORK.get(category, [])
+                asked = category_counts.get(category, 0)
+
+                if asked < len(questions):
+                    question_id, question = questions[asked]
+                    return {
+                        "id": question_id,
+                        "category": category,
+                        "question": question,
+                        "answered": False
+                    }
 
-                if questions:
-                    question_num = len([q for q in clarification["questions"] if q.get("category") == category]) + 1
+        return None
 
-                    if question_num <= len(questions):
-                        return {
-                            "id": f"{category}_{question_num}",
-                            "category": category,
-                            "question": questions[question_num - 1],
-                            "answered": False
-                        }
+    def _category_answers(self, clarification: Dict) -> Dict[str, List[str]]:
+        """Get the answer ids of a clarification session grouped by category.
 
+        Ids are in answer order. Sessions saved before the grouping existed
+        get it rebuilt from their answers once.
+        """
+        if "category_answers" not in clarification:
+            grouped: Dict[str, List[str]] = {category: [] for category, _, _ in ANSWER_CATEGORIES}
+            for question_id in clarification.get("answers", {}):
+                category = self._answer_category(question_id)
+                if category is not None:
+                    grouped[category].append(question_id)
+            clarification["category_answers"] = grouped
+        return clarification["category_answers"]
+
+    @staticmethod
+    def _answer_category(question_id: str) -> Optional[str]:
+        """Category an answer id is scored under, if any."""
+        # Generated ids: drop follow-up suffixes and the question number
+        stem = question_id
+        while stem.endswith("_followup"):
+            stem = stem[:-len("_followup")]
+        stem, _, number = stem.rpartition("_")
+        if number.isdigit() and stem in ANSWER_ID_STEMS:
+            return ANSWER_ID_STEMS[stem]
+
+        # Any other id falls back to prefix matching
+        for category, prefix, _ in ANSWER_CATEGORIES:
+            if question_id.startswith(prefix):
+                return category
         return None
 
-    def _calculate_clarity_score(self, answers: Dict) -> int:
+    def _record_answer(self, clarification: Dict, question_id: str, answer: Dict):
+        """Store an answer and file its id under its category."""
+        grouped = self._category_answers(clarification)
+        if question_id not in clarification["answers"]:
+            category = self._answer_category(question_id)
+            if category is not None:
+                grouped[category].append(question_id)
+        clarification["answers"][question_id] = answer
+
+    def _calculate_clarity_score(self, clarification: Dict) -> int:
         """Calculate objective clarity score."""
         score = 0
+        answers = clarification.get("answers", {})
+        grouped = self._category_answers(clarification)
 
         # Problem specificity (20 points)
-        problem_answers = [a for k, a in answers.items() if k.startswith("problem_")]
-        if problem_answers:
-            if len(problem_answers[0].get("answer", "")) > 50:
+        problem_ids = grouped["problem_definition"]
+        if problem_ids:
+            answer_len = len(answers[problem_ids[0]].get("answer", ""))
+            if answer_len > 50:
                 score += 20
-            elif len(problem_answers[0].get("answer", "")) > 20:
+            elif answer_len > 20:
                 score += 10
 
         # Target user clarity (20 points)
-        user_answers = [a for k, a in answers.items() if k.startswith("target_user")]
-        if user_answers:
-            answer_text = user_answers[0].get("answer", "")
+        user_ids = grouped["target_user"]
+        if user_ids:
+            answer_text = answers[user_ids[0]].get("answer", "")
             # Check for specific examples
-            if re.search(r'\d', answer_text) or "example" in answer_text.lower():
+            if DIGIT_PATTERN.search(answer_text) or "example" in answer_text.lower():
                 score += 20
             elif len(answer_text) > 30:
                 score += 10
 
         # Solution specificity (20 points)
-        solution_answers = [a for k, a in answers.items() if k.startswith("solution_")]
-        if solution_answers:
-            if len(solution_answers) >= 3:
-                score += 20
-            elif len(solution_answers) >= 2:
-                score += 15
-            elif len(solution_answers) >= 1:
-                score += 10
+        solution_count = len(grouped["solution"])
+        if solution_count >= 3:
+            score += 20
+        elif solution_count >= 2:
+            score += 15
+        elif solution_count >= 1:
+            score += 10
 
         # Measurable metrics (20 points)
-        metrics_answers = [a for k, a in answers.items() if k.startswith("success_metrics")]
-        if metrics_answers:
-            answer_text = " ".join([a.get("answer", "") for a in metrics_answers])
+        metrics_ids = grouped["success_metrics"]
+        if metrics_ids:
+            answer_text = " ".join([answers[k].get("answer", "") for k in metrics_ids])
             # Check for numbers
-            if re.search(r'\d+', answer_text):
+            if DIGIT_PATTERN.search(answer_text):
                 score += 20
             elif len(answer_text) > 30:
                 score += 10
 
         # Constraints defined (20 points)
-        constraints_answers = [a for k, a in answers.items() if k.startswith("constraints")]
-        if constraints_answers:
-            if len(constraints_answers) >= 3:
-                score += 20
-            elif len(constraints_answers) >= 2:
-                score += 15
-            elif len(constraints_answers) >= 1:
-                score += 10
+        constraints_count = len(grouped["constraints"])
+        if constraints_count >= 3:
+            score += 20
+        elif constraints_count >= 2:
+            score += 15
+        elif constraints_count >= 1:
+            score += 10
 
         return min(score, 100)
 
-    def _identify_weak_areas(self, answers: Dict) -> List[str]:
+    def _identify_weak_areas(self, clarification: Dict) -> List[str]:
         """Identify areas needing more clarity."""
         weak_areas = []
+        grouped = self._category_answers(clarification)
 
-        categories = ["problem_definition", "target_user", "solution", "success_metrics", "constraints"]
-
-        for category in categories:
-            category_answers = [a for k, a in answers.items() if k.startswith(category)]
+        for category, _, _ in ANSWER_CATEGORIES:
+            # Weak areas count answer ids named after the full category
+            count = sum(1 for k in grouped[category] if k.startswith(category))
 
-            if not category_answers:
+            if not count:
                 weak_areas.append(f"Missing: {category.replace('_', ' ')}")
-            elif len(category_answers) < 2:
+            elif count < 2:
                 weak_areas.append(f"Needs more detail: {category.replace('_', ' ')}")
 
         return weak_areas
 
-    def _generate_objective_summary(self, answers: Dict) -> Dict:
+    def _generate_objective_summary(self, clarification: Dict) -> Dict:
         """Generate objective summary from answers."""
-        summary = {
-            "problem": "",
-            "target_user": "",
-            "solution": "",
-            "success_metrics": "",
-            "constraints": ""
-        }
+        answers = clarification["answers"]
+        grouped = self._category_answers(clarification)
 
-        # Extract key information
-        for question_id, answer_data in answers.items():
-            answer = answer_data.get("answer", "")
-
-            if question_id.startswith("problem_"):
-                summary["problem"] += answer + " "
-            elif question_id.startswith("target_user"):
-                summary["target_user"] += answer + " "
-            elif question_id.startswith("solution_"):
-                summary["solution"] += answer + " "
-            elif question_id.startswith("success_metrics"):
-                summary["success_metrics"] += answer + " "
-            elif question_id.startswith("constraints"):
-                summary["constraints"] += answer + " "
-
-        # Clean up
-        for key in summary:
-            summary[key] = summary[key].strip()
-
-        return summary
+        # Each field joins its category's answers in answer order
+        return {
+            key: " ".join([answers[k].get("answer", "") for k in grouped[category]]).strip()
+            for category, _, key in ANSWER_CATEGORIES
+        }
 
     def score_objective_clarity(self, project_path: str) -> Dict:
         """Score objective clarity."""
@@ -1072,9 +1474,8 @@ For each sub-task, call:
                 "message": "Objective clarification not started"
             }
 
-        answers = clarification.get("answers", {})
-        score = self._calculate_clarity_score(answers)
-        weak_areas = self._identify_weak_areas(answers)
+        score = self._calculate_clarity_score(clarification)
+        weak_areas = self._identify_weak_areas(clarification)
 
         return {
             "score": score,
@@ -1089,7 +1490,7 @@ For each sub-task, call:
         clarification = data.get("objective_clarification", {})
 
         # Check clarity score
-        score = self._calculate_clarity_score(clarification.get("answers", {}))
+        score = self._calculate_clarity_score(clarification)
 
         if score < 80:
             return {
@@ -1099,14 +1500,15 @@ For each sub-task, call:
             }
 
         # Generate objective
-        objective = self._generate_objective_summary(clarification["answers"])
+        objective = self._generate_objective_summary(clarification)
         objective["clarity_score"] = score
-        objective["defined_at"] = datetime.now().isoformat()
+        now = datetime.now()
+        objective["defined_at"] = now.isoformat()
 
         data["objective"] = objective
 
         # Create PROJECT_PLAN.md
-        self._create_project_plan(project_path, objective)
+        self._create_project_plan(project_path, objective, now)
 
         self._save_project_data(project_path, data)
 
@@ -1117,16 +1519,15 @@ For each sub-task, call:
             "project_plan_created": True
         }
 
-    def _create_project_plan(self, project_path: str, objective: Dict):
+    def _create_project_plan(self, project_path: str, objective: Dict, now: Optional[datetime] = None):
         """Create PROJECT_PLAN.md file."""
-        docs_path = Path(project_path) / "docs" / "notes"
-        docs_path.mkdir(parents=True, exist_ok=True)
-
-        plan_path = docs_path / "PROJECT_PLAN.md"
+        now = now or datetime.now()
+        plan_path = self._get_plan_path(project_path)
+        plan_path.parent.mkdir(parents=True, exist_ok=True)
 
         plan_content = f"""# Project Plan
 
-Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+Last Updated: {now.strftime('%Y-%m-%d %H:%M')}
 
 ## 🎯 OBJECTIVE (Clarity Score: {objective.get('clarity_score', 0)}/100)
 
@@ -1175,7 +1576,7 @@ None yet.
 
 ## 📊 Objective Alignment Audit
 
-Last Audit: {datetime.now().strftime('%Y-%m-%d')}
+Last Audit: {now.strftime('%Y-%m-%d')}
 Score: N/A (no tasks yet)
 
 ---
@@ -1183,8 +1584,7 @@ Score: N/A (no tasks yet)
 *Generated by Project Manager MCP*
 """
 
-        with open(plan_path, 'w') as f:
-            f.write(plan_content)
+        atomic_write(plan_path, plan_content.encode("utf-8"))
 
     def validate_task_alignment(
         self,
@@ -1221,21 +1621,11 @@ Score: N/A (no tasks yet)
 
     def _calculate_task_alignment_score(self, task_description: str, objective: Dict) -> int:
         """Calculate how well task aligns with objective."""
-        score = 50  # Base score
-
-        task_lower = task_description.lower()
-
-        # Check if task relates to problem
-        problem_keywords = objective.get("problem", "").lower().split()
-        matches = sum(1 for word in problem_keywords if len(word) > 4 and word in task_lower)
-        score += min(matches * 10, 30)
-
-        # Check if task relates to solution
-        solution_keywords = objective.get("solution", "").lower().split()
-        matches = sum(1 for word in solution_keywords if len(word) > 4 and word in task_lower)
-        score += min(matches * 10, 20)
-
-        return min(score, 100)
+        return task_alignment_score(
+            task_description,
+            objective.get("problem", ""),
+            objective.get("solution", "")
+        )
 
     def validate_task_size(self, task_description: str) -> Dict:
         """Validate task is small enough."""
@@ -1246,8 +1636,7 @@ Score: N/A (no tasks yet)
             issues.append("Task description is very long (>200 chars). Consider breaking down.")
 
         # Check for multiple actions
-        action_words = ["and", "then", "after", "also", "plus"]
-        count = sum(1 for word in action_words if word in task_description.lower())
+        count = len(ACTION_WORD_PATTERN.findall(task_description))
 
         if count >= 3:
             issues.append(f"Task contains {count} connecting words (and, then, etc). Break into separate tasks.")
@@ -1278,54 +1667,47 @@ Score: N/A (no tasks yet)
         if not objective:
             return {"error": "No objective defined"}
 
-        # Get all pending tasks
-        tasks = data.get("tasks", [])
-        pending_tasks = [t for t in tasks if t.get("status") == "pending"]
+        # Objective fields read once for every task scored below
+        problem = objective.get("problem", "")
+        solution = objective.get("solution", "")
 
-        if not pending_tasks:
+        # Any pending tasks at all?
+        tasks = data.get("tasks", [])
+        if not any(t.get("status") == "pending" for t in tasks):
             return {
                 "challenge": False,
                 "message": "No other pending tasks to compare"
             }
 
         # Find this task
-        this_task = next((t for t in tasks if t.get("id") == task_id), None)
+        position = self._task_position(tasks, task_id)
 
-        if not this_task:
+        if position is None:
             return {"error": "Task not found"}
-
-        # Score all pending tasks
-        scored_tasks = []
-        for task in pending_tasks:
-            if task.get("id") != task_id:
-                score = self._calculate_task_alignment_score(
-                    task.get("description", ""),
-                    objective
-                )
-                scored_tasks.append({
-                    "id": task["id"],
-                    "description": task["description"],
-                    "alignment_score": score
-                })
-
-        # Sort by score
-        scored_tasks.sort(key=lambda x: x["alignment_score"], reverse=True)
+        this_task = tasks[position]
 
         # Get this task's score
-        this_score = self._calculate_task_alignment_score(
-            this_task.get("description", ""),
-            objective
-        )
+        this_score = task_alignment_score(this_task.get("description", ""), problem, solution)
 
-        # Check if others are higher priority
-        higher_priority = [t for t in scored_tasks if t["alignment_score"] > this_score]
+        # Keep only the other pending tasks that outscore it
+        higher_priority = []
+        for task in tasks:
+            if task.get("status") == "pending" and task.get("id") != task_id:
+                score = task_alignment_score(task.get("description", ""), problem, solution)
+                if score > this_score:
+                    higher_priority.append({
+                        "id": task["id"],
+                        "description": task["description"],
+                        "alignment_score": score
+                    })
 
         if higher_priority:
             return {
                 "challenge": True,
                 "message": "Higher priority tasks exist",
                 "this_task_score": this_score,
-                "higher_priority_tasks": higher_priority[:3],  # Top 3
+                # Top 3 (nlargest is stable, like the full sort it replaces)
+                "higher_priority_tasks": heapq.nlargest(3, higher_priority, key=itemgetter("alignment_score")),
                 "recommendation": "Consider working on higher-impact tasks first"
             }
 
@@ -1336,6 +1718,14 @@ Score: N/A (no tasks yet)
             "proceed": True
         }
 
+    @staticmethod
+    def _task_position(tasks: List[Dict], task_id: str) -> Optional[int]:
+        """Index of the task with task_id in tasks, or None."""
+        for position, task in enumerate(tasks):
+            if task.get("id") == task_id:
+                return position
+        return None
+
     def mark_task_complete(
         self,
         project_path: str,
@@ -1355,21 +1745,36 @@ Score: N/A (no tasks yet)
 
         # Find and update task
         tasks = data.get("tasks", [])
-        task = next((t for t in tasks if t.get("id") == task_id), None)
+        position = self._task_position(tasks, task_id)
 
-        if not task:
+        if position is None:
             return {"error": "Task not found"}
 
+        # Move to completed (task ids are unique, so one pop removes it)
+        task = tasks.pop(position)
+        data["tasks"] = tasks
+
         # Mark complete
+        now = datetime.now()
         task["status"] = "completed"
-        task["completed_at"] = datetime.now().isoformat()
-
-        # Move to completed
-        data["completed_tasks"].append(task)
-        data["tasks"] = [t for t in tasks if t.get("id") != task_id]
+        task["completed_at"] = now.isoformat()
+        completed = data["completed_tasks"]
+        data["completed_count"] = data.get("completed_count", len(completed)) + 1
+        completed.append(task)
+
+        # Keep only recent completions in project data; archive the rest
+        if len(completed) > RECENT_COMPLETED_TASKS:
+            overflow = len(completed) - RECENT_COMPLETED_TASKS
+            archive_path = self._get_completed_archive_path(project_path)
+            archived = b"".join(json_dumps(t) + b"\n" for t in completed[:overflow])
+            # A retry after a failed save archives the same tasks again; if the
+            # first attempt got them into the archive they are its last lines
+            if not self._log_ends_with(archive_path, archived):
+                self._append_log(archive_path, archived)
+            del completed[:overflow]
 
         # Update PROJECT_PLAN.md
-        self._update_project_plan(project_path, data)
+        self._update_project_plan(project_path, data, now)
 
         # Log to artifacts
         self._log_task_completion(project_path, task)
@@ -1383,9 +1788,9 @@ Score: N/A (no tasks yet)
             "plan_updated": True
         }
 
-    def _update_project_plan(self, project_path: str, data: Dict):
+    def _update_project_plan(self, project_path: str, data: Dict, now: Optional[datetime] = None):
         """Update PROJECT_PLAN.md."""
-        plan_path = Path(project_path) / "docs" / "notes" / "PROJECT_PLAN.md"
+        plan_path = self._get_plan_path(project_path)
 
         if not plan_path.exists():
             return
@@ -1393,17 +1798,15 @@ Score: N/A (no tasks yet)
         objective = data.get("objective", {})
         tasks = data.get("tasks", [])
         completed = data.get("completed_tasks", [])
+        completed_count = data.get("completed_count", len(completed))
 
         # Calculate progress
-        total_tasks = len(tasks) + len(completed)
-        progress = (len(completed) / total_tasks * 100) if total_tasks > 0 else 0
-
-        # Regenerate plan
-        plan_content = f"""# Project Plan
+        total_tasks = len(tasks) + completed_count
+        progress = (completed_count / total_tasks * 100) if total_tasks > 0 else 0
 
-Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-
-## 🎯 OBJECTIVE (Clarity Score: {objective.get('clarity_score', 0)}/100)
+        # Regenerate plan (everything below the "Last Updated" line), collected
+        # as fragments and joined once
+        parts = [f"""## 🎯 OBJECTIVE (Clarity Score: {objective.get('clarity_score', 0)}/100)
 
 **Problem**: {objective.get('problem', 'Not defined')}
 
@@ -1419,52 +1822,111 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
 ## Current Status
 
-**Progress**: {len(completed)}/{total_tasks} tasks complete ({progress:.1f}%)
+**Progress**: {completed_count}/{total_tasks} tasks complete ({progress:.1f}%)
 **Objective Alignment**: Good
 
 ---
 
 ## 📋 Current Task
 
-"""
+"""]
+
+        # One pass buckets the tasks: first in-progress task plus pending ones
+        current_task = None
+        pending = []
+        for task in tasks:
+            status = task.get("status")
+            if status == "pending":
+                pending.append(task)
+            elif status == "in_progress" and current_task is None:
+                current_task = task
 
         # Add current task
-        current_task = next((t for t in tasks if t.get("status") == "in_progress"), None)
         if current_task:
-            plan_content += f"""
+            parts.append(f"""
 **Task**: {current_task.get('description')}
 **Status**: In Progress
 **Started**: {current_task.get('started_at', 'Unknown')}
 
-"""
+""")
         else:
-            plan_content += "No task currently in progress.\n\n"
+            parts.append("No task currently in progress.\n\n")
 
         # Add pending tasks
-        plan_content += "## 📝 Upcoming Tasks\n\n"
-        pending = [t for t in tasks if t.get("status") == "pending"]
-        for task in pending[:5]:
-            plan_content += f"- {task.get('description')}\n"
+        parts.append("## 📝 Upcoming Tasks\n\n")
+        parts.extend(f"- {task.get('description')}\n" for task in pending[:5])
 
         # Add completed tasks
-        plan_content += "\n## ✅ Completed Tasks\n\n"
-        for task in completed[-10:]:  # Last 10
-            plan_content += f"- ✅ {task.get('description')} ({task.get('completed_at', 'Unknown')})\n"
+        parts.append("\n## ✅ Completed Tasks\n\n")
+        parts.extend(
+            f"- ✅ {task.get('description')} ({task.get('completed_at', 'Unknown')})\n"
+            for task in completed[-RECENT_COMPLETED_TASKS:]
+        )
+
+        parts.append("\n---\n\n*Generated by Project Manager MCP*\n")
+        plan_content = "".join(parts)
+
+        # Skip the rewrite when the plan we last wrote is untouched and its
+        # content would only differ in the timestamp
+        st = plan_path.stat()
+        with self._cache_lock:
+            cached = self._plan_cache.get(plan_path)
+        if cached is not None and cached == ((st.st_mtime_ns, st.st_size, st.st_ino), plan_content):
+            return
 
-        plan_content += "\n---\n\n*Generated by Project Manager MCP*\n"
+        now = now or datetime.now()
+        header = f"# Project Plan\n\nLast Updated: {now.strftime('%Y-%m-%d %H:%M')}\n\n"
+        atomic_write(plan_path, (header + plan_content).encode("utf-8"))
 
-        with open(plan_path, 'w') as f:
-            f.write(plan_content)
+        st = plan_path.stat()
+        with self._cache_lock:
+            self._plan_cache[plan_path] = ((st.st_mtime_ns, st.st_size, st.st_ino), plan_content)
+            self._plan_cache.move_to_end(plan_path)
+            if len(self._plan_cache) > PROJECT_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
 
     def _log_task_completion(self, project_path: str, task: Dict):
         """Log task completion to artifacts."""
-        log_path = Path(project_path) / "artifacts" / "logs" / "completed-actions.log"
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path = self._get_completion_log_path(project_path)
 
-        log_entry = f"[{datetime.now().isoformat()}] TASK COMPLETED: {task.get('description')}\n"
+        # Stamped with the completion time recorded on the task
+        completed_at = task.get("completed_at") or datetime.now().isoformat()
+        log_entry = f"[{completed_at}] TASK COMPLETED: {task.get('description')}\n"
 
-        with open(log_path, 'a') as f:
-            f.write(log_entry)
+        self._append_log(log_path, log_entry.encode("utf-8"))
+
+    def _append_log(self, log_path: Path, payload: bytes):
+        """Append to a log file with a single O_APPEND write.
+
+        Opened per call, so rotated or deleted logs are recreated and no
+        handles are held between calls; the directory is only created when
+        the open finds it missing.
+        """
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            fd = os.open(log_path, flags, 0o644)
+        except FileNotFoundError:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(log_path, flags, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _log_ends_with(log_path: Path, payload: bytes) -> bool:
+        """Check whether a log file's last bytes are exactly payload (reads only those)."""
+        try:
+            f = open(log_path, 'rb')
+        except FileNotFoundError:
+            return False
+
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            if size < len(payload):
+                return False
+            f.seek(size - len(payload))
+            return f.read() == payload
 
     def get_current_status(self, project_path: str) -> Dict:
         """Get current project status."""
@@ -1472,19 +1934,27 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
         objective = data.get("objective")
         tasks = data.get("tasks", [])
-        completed = data.get("completed_tasks", [])
+        completed_count = data.get("completed_count", len(data.get("completed_tasks", [])))
 
-        total_tasks = len(tasks) + len(completed)
-        progress = (len(completed) / total_tasks * 100) if total_tasks > 0 else 0
+        total_tasks = len(tasks) + completed_count
+        progress = (completed_count / total_tasks * 100) if total_tasks > 0 else 0
 
-        current_task = next((t for t in tasks if t.get("status") == "in_progress"), None)
+        # One pass for both the pending count and the first in-progress task
+        pending_count = 0
+        current_task = None
+        for task in tasks:
+            status = task.get("status")
+            if status == "pending":
+                pending_count += 1
+            elif status == "in_progress" and current_task is None:
+                current_task = task
 
         return {
             "has_objective": objective is not None,
             "objective_clarity_score": objective.get("clarity_score", 0) if objective else 0,
             "total_tasks": total_tasks,
-            "completed_tasks": len(completed),
-            "pending_tasks": len([t for t in tasks if t.get("status") == "pending"]),
+            "completed_tasks": completed_count,
+            "pending_tasks": pending_count,
             "progress_percent": progress,
             "current_task": current_task.get("description") if current_task else None,
             "objective_summary": {
@@ -1504,11 +1974,16 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
         tasks = data.get("tasks", [])
         scope_creep = []
 
+        # Objective fields read once for every task scored below
+        problem = objective.get("problem", "")
+        solution = objective.get("solution", "")
+
+        # Without keywords every task would score the base 50 and be flagged
+        if not objective_keywords(problem) and not objective_keywords(solution):
+            return {"error": "Objective lacks substantive keywords - cannot score alignment"}
+
         for task in tasks:
-            score = self._calculate_task_alignment_score(
-                task.get("description", ""),
-                objective
-            )
+            score = task_alignment_score(task.get("description", ""), problem, solution)
 
             if score < 70:
                 scope_creep.append({
@@ -1535,31 +2010,24 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
         tasks = data.get("tasks", [])
 
-        # Score all tasks
-        scored_tasks = []
-        for task in tasks:
-            score = self._calculate_task_alignment_score(
-                task.get("description", ""),
-                objective
-            )
-            scored_tasks.append({
-                "task": task,
-                "score": score
-            })
+        # Objective fields read once for every task scored below
+        problem = objective.get("problem", "")
+        solution = objective.get("solution", "")
 
-        # Sort by score
-        scored_tasks.sort(key=lambda x: x["score"], reverse=True)
+        # Score all tasks, then order task positions by score (stable, best first)
+        scores = [task_alignment_score(task.get("description", ""), problem, solution) for task in tasks]
+        order = sorted(range(len(tasks)), key=scores.__getitem__, reverse=True)
 
         # Reorganize: high priority first
-        data["tasks"] = [st["task"] for st in scored_tasks]
+        data["tasks"] = [tasks[i] for i in order]
 
         # Create audit entry
         audit = {
             "timestamp": datetime.now().isoformat(),
             "action": "refocus_on_objective",
             "tasks_reordered": len(tasks),
-            "highest_score": scored_tasks[0]["score"] if scored_tasks else 0,
-            "lowest_score": scored_tasks[-1]["score"] if scored_tasks else 0
+            "highest_score": scores[order[0]] if order else 0,
+            "lowest_score": scores[order[-1]] if order else 0
         }
         data["audits"].append(audit)
 
@@ -1569,7 +2037,7 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
             "success": True,
             "message": "Tasks reordered by objective alignment",
             "tasks_reordered": len(tasks),
-            "highest_priority": scored_tasks[0]["task"]["description"] if scored_tasks else None,
+            "highest_priority": data["tasks"][0]["description"] if order else None,
             "audit_logged": True
         }
 
@@ -1597,13 +2065,14 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
             }
 
         # Generate tasks (placeholder - in real implementation would use AI)
-        tasks = self._generate_tasks_from_objective(objective)
+        now = datetime.now()
+        tasks = self._generate_tasks_from_objective(objective, now)
 
         data["tasks"] = tasks
         self._save_project_data(project_path, data)
 
-        # Update PROJECT_PLAN.md
-        self._update_project_plan(project_path, data)
+        # Update PROJECT_PLAN.md (stamped with the tasks' creation time)
+        self._update_project_plan(project_path, data, now)
 
         return {
             "success": True,
@@ -1612,27 +2081,28 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
             "tasks": [{"id": t["id"], "description": t["description"]} for t in tasks]
         }
 
-    def _generate_tasks_from_objective(self, objective: Dict) -> List[Dict]:
+    def _generate_tasks_from_objective(self, objective: Dict, now: Optional[datetime] = None) -> List[Dict]:
         """Generate tasks from objective (placeholder)."""
         # In real implementation, would use AI to break down objective into tasks
+        created_at = (now or datetime.now()).isoformat()
         return [
             {
                 "id": "task_1",
                 "description": "Set up project structure and initial files",
                 "status": "pending",
-                "created_at": datetime.now().isoformat()
+                "created_at": created_at
             },
             {
                 "id": "task_2",
                 "description": "Implement core feature (from objective)",
                 "status": "pending",
-                "created_at": datetime.now().isoformat()
+                "created_at": created_at
             },
             {
                 "id": "task_3",
                 "description": "Add tests for core feature",
                 "status": "pending",
-                "created_at": datetime.now().isoformat()
+                "created_at": created_at
             }
         ]
 
@@ -1648,6 +2118,9 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
 async def main():
     """Main entry point."""
+    if orjson is None:
+        # stderr only: stdout carries the MCP protocol
+        print("project-server: orjson not installed; using slower stdlib json", file=sys.stderr)
     server = ProjectServer()
     await server.run()
 
@@ -4,22 +4,41 @@ Code Quality Guardian MCP Server
 Automated quality enforcement and best-practice validation
 """
 import asyncio
+import copy
 import json
+import mmap
 import os
 import subprocess
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, Prompt, PromptArgument, GetPromptResult, PromptMessage
 
+# Lines whose first non-blank character is '#', matched directly on raw bytes
+COMMENT_LINE_PATTERN = re.compile(rb'^[ \t]*#', re.MULTILINE)
+
+# Per-line checks, compiled once; group 1 is the defined name
+DEF_PATTERN = re.compile(r'^\s*def (\w+)')
+CLASS_PATTERN = re.compile(r'^\s*class (\w+)')
+CAMEL_CASE_DEF_PATTERN = re.compile(r'def [a-z]+[A-Z]')
+BARE_EXCEPT_PATTERN = re.compile(r'except\s*:')
+
+# Directories never scanned for project files
+SKIPPED_DIRS = frozenset({'venv', '__pycache__', '.git', 'node_modules'})
+
 
 class QualityServer:
     """Code quality guardian server."""
 
+    # Directories autonomous tasks may touch (tuple so str.startswith checks all in C)
+    _APPROVED_DIRS = ("src/", "tests/", "docs/", "mcp-servers/")
+
     def __init__(self):
         self.server = Server("quality-server")
+        # Last verify_standards result, keyed by project path + tree fingerprint
+        self._verify_cache: Optional[Tuple[tuple, Dict]] = None
         self.setup_handlers()
 
     def setup_handlers(self):
@@ -721,7 +740,8 @@ safety check  # If safety is installed
             lines = content.split('\n')
             for i, line in enumerate(lines):
                 # Check for function definitions
-                if re.match(r'^\s*def \w+', line) and not line.startswith('    '):
+                def_match = DEF_PATTERN.match(line)
+                if def_match and not line.startswith('    '):
                     # Check if next non-empty line is docstring
                     next_line_idx = i + 1
                     while next_line_idx < len(lines) and not lines[next_line_idx].strip():
@@ -730,20 +750,19 @@ safety check  # If safety is installed
                     if next_line_idx < len(lines):
                         next_line = lines[next_line_idx].strip()
                         if not next_line.startswith('"""') and not next_line.startswith("'''"):
-                            match = re.search(r'def (\w+)', line)
-                            if match:
-                                func_name = match.group(1)
-                                if not func_name.startswith('_'):  # Public functions only
-                                    issues.append({
-                                        "file": file_path,
-                                        "line": i + 1,
-                                        "severity": "warning",
-                                        "issue": f"Missing docstring for function '{func_name}'",
-                                        "suggestion": "Add Google-style docstring"
-                                    })
+                            func_name = def_match.group(1)
+                            if not func_name.startswith('_'):  # Public functions only
+                                issues.append({
+                                    "file": file_path,
+                                    "line": i + 1,
+                                    "severity": "warning",
+                                    "issue": f"Missing docstring for function '{func_name}'",
+                                    "suggestion": "Add Google-style docstring"
+                                })
 
                 # Check for class definitions
-                if re.match(r'^\s*class \w+', line):
+                class_match = CLASS_PATTERN.match(line)
+                if class_match:
                     next_line_idx = i + 1
                     while next_line_idx < len(lines) and not lines[next_line_idx].strip():
                         next_line_idx += 1
@@ -751,16 +770,14 @@ safety check  # If safety is installed
                     if next_line_idx < len(lines):
                         next_line = lines[next_line_idx].strip()
                         if not next_line.startswith('"""') and not next_line.startswith("'''"):
-                            match = re.search(r'class (\w+)', line)
-                            if match:
-                                class_name = match.group(1)
-                                issues.append({
-                                    "file": file_path,
-                                    "line": i + 1,
-                                    "severity": "warning",
-                                    "issue": f"Missing docstring for class '{class_name}'",
-                                    "suggestion": "Add Google-style docstring"
-                                })
+                            class_name = class_match.group(1)
+                            issues.append({
+                                "file": file_path,
+                                "line": i + 1,
+                                "severity": "warning",
+                                "issue": f"Missing docstring for class '{class_name}'",
+                                "suggestion": "Add Google-style docstring"
+                            })
 
         except Exception as e:
             issues.append({
@@ -782,7 +799,7 @@ safety check  # If safety is installed
             lines = content.split('\n')
             for i, line in enumerate(lines):
                 # Check for camelCase in function names (should be snake_case)
-                if re.search(r'def [a-z]+[A-Z]', line):
+                if CAMEL_CASE_DEF_PATTERN.search(line):
                     issues.append({
                         "file": file_path,
                         "line": i + 1,
@@ -805,7 +822,7 @@ safety check  # If safety is installed
                 content = f.read()
 
             # Check for bare except clauses
-            if re.search(r'except\s*:', content):
+            if BARE_EXCEPT_PATTERN.search(content):
                 issues.append({
                     "file": file_path,
                     "severity": "warning",
@@ -833,14 +850,13 @@ safety check  # If safety is installed
             func_lines = 0
 
             for i, line in enumerate(lines):
-                if re.match(r'^\s*def \w+', line):
+                match = DEF_PATTERN.match(line)
+                if match:
                     # Start of function
-                    match = re.search(r'def (\w+)', line)
-                    if match:
-                        in_function = True
-                        func_name = match.group(1)
-                        func_start = i + 1
-                        func_lines = 0
+                    in_function = True
+                    func_name = match.group(1)
+                    func_start = i + 1
+                    func_lines = 0
                 elif in_function:
                     # Check if function ended
                     if line and not line[0].isspace() and line.strip():
@@ -906,15 +922,12 @@ safety check  # If safety is installed
 
         for py_file in py_files:
             try:
-                with open(py_file) as f:
-                    content = f.read()
-
-                # Check for large commented blocks
-                commented_lines = [line for line in content.split('\n') if line.strip().startswith('#')]
-                if len(commented_lines) > 10:
+                # Check for large commented blocks (mmap avoids reading + decoding the file)
+                commented_lines = self._count_commented_lines(py_file)
+                if commented_lines > 10:
                     obsolete_items["commented_code"].append({
                         "file": py_file,
-                        "commented_lines": len(commented_lines),
+                        "commented_lines": commented_lines,
                         "recommendation": "Remove or move to .archive/"
                     })
 
@@ -935,12 +948,21 @@ safety check  # If safety is installed
             "recommendation": "Clean up to maintain code hygiene"
         }
 
+    def _count_commented_lines(self, file_path: str) -> int:
+        """Count '#'-prefixed lines by scanning the memory-mapped file bytes."""
+        with open(file_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return sum(1 for _ in COMMENT_LINE_PATTERN.finditer(mm))
+
     def _find_python_files(self, path: str) -> List[str]:
         """Find all Python files in project."""
         py_files = []
         for root, dirs, files in os.walk(path):
             # Skip venv, __pycache__, etc.
-            dirs[:] = [d for d in dirs if d not in ['venv', '__pycache__', '.git', 'node_modules']]
+            dirs[:] = [d for d in dirs if d not in SKIPPED_DIRS]
             py_files.extend([os.path.join(root, f) for f in files if f.endswith('.py')])
         return py_files
 
@@ -967,12 +989,6 @@ safety check  # If safety is installed
         """Update CHANGELOG.md."""
         changelog_path = os.path.join(project_path, "CHANGELOG.md")
 
-        # Create if doesn't exist
-        if not os.path.exists(changelog_path):
-            with open(changelog_path, 'w') as f:
-                f.write("# Changelog\n\nAll notable changes to this project will be documented in this file.\n\n")
-
-        # Append entry
         timestamp = subprocess.run(
             ['date', '+%Y-%m-%d'],
             capture_output=True,
@@ -981,8 +997,14 @@ safety check  # If safety is installed
 
         entry_text = f"\n## [{version}] - {timestamp}\n\n{entry}\n"
 
-        with open(changelog_path, 'a') as f:
-            f.write(entry_text)
+        # Single append-mode open; write the header only if the file is new/empty
+        fd = os.open(changelog_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size == 0:
+                os.write(fd, b"# Changelog\n\nAll notable changes to this project will be documented in this file.\n\n")
+            os.write(fd, entry_text.encode("utf-8"))
+        finally:
+            os.close(fd)
 
         return {
             "success": True,
@@ -990,8 +1012,43 @@ safety check  # If safety is installed
             "changelog_path": changelog_path
         }
 
+    def _standards_cache_key(self, project_path: str) -> tuple:
+        """Tree fingerprint: (path, mtime_ns, size) of every entry the audits walk.
+
+        Stat-only, so far cheaper than the audits themselves, and any edit,
+        add, remove or rename anywhere in the tree changes the key.
+        """
+        fingerprint = []
+        pending = [project_path]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    stat = entry.stat(follow_symlinks=False)
+                    fingerprint.append((entry.path, stat.st_mtime_ns, stat.st_size))
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in SKIPPED_DIRS:
+                        pending.append(entry.path)
+        fingerprint.sort()
+        return (os.path.abspath(project_path), tuple(fingerprint))
+
+    def invalidate_standards_cache(self) -> None:
+        """Drop the memoized verify_standards result, forcing the next call to re-audit."""
+        self._verify_cache = None
+
     def verify_standards(self, project_path: str) -> Dict:
-        """Comprehensive standards verification."""
+        """Comprehensive standards verification.
+
+        Memoized on a stat fingerprint of the whole tree, since the audits
+        below all read and traverse it. Returns a copy, so callers may modify
+        the result without touching the memo.
+        """
+        try:
+            key = self._standards_cache_key(project_path)
+        except OSError:
+            key = None
+
+        if key is not None and self._verify_cache and self._verify_cache[0] == key:
+            return copy.deepcopy(self._verify_cache[1])
+
         results = {
             "structure": self.audit_project_structure(project_path),
             "file_placement": self.validate_file_placement(project_path),
@@ -1005,12 +1062,17 @@ safety check  # If safety is installed
 
         overall_score = (structure_score + placement_score) / 2
 
-        return {
+        verification = {
             "overall_score": max(0, overall_score),
             "results": results,
             "passed": overall_score >= 80
         }
 
+        if key is not None:
+            self._verify_cache = (key, copy.deepcopy(verification))
+
+        return verification
+
     def run_quality_gate(self, project_path: str, changes_made: Optional[List[str]] = None) -> Dict:
         """Run MANDATORY quality gate."""
         # Check if quality script exists
@@ -1220,10 +1282,9 @@ safety check  # If safety is installed
                 })
 
         # Validate file paths in approved directories
-        approved_dirs = ["src/", "tests/", "docs/", "mcp-servers/"]
         for file_path in file_changes:
             # Check if file is in approved directory
-            if not any(file_path.startswith(d) for d in approved_dirs):
+            if not file_path.startswith(self._APPROVED_DIRS):
                 violations.append({
                     "severity": "HIGH",
                     "violation": f"File outside approved directories: {file_path}",
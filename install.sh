@@ -19,6 +19,7 @@ mkdir -p "$PROJECT_DIR/mcp-servers"
 
 # Copy MCP servers
 cp -r "$TOOLKIT_DIR/mcp-servers/"* "$PROJECT_DIR/mcp-servers/"
+rm -rf "$PROJECT_DIR/mcp-servers/__pycache__"
 echo "✅ MCP servers installed"
 
 # Copy quality gate
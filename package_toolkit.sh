@@ -14,8 +14,10 @@ VERSION="1.0.0"
 OUTPUT_DIR="dist"
 PACKAGE_NAME="${TOOLKIT_NAME}-v${VERSION}"
 
-# Create output directory
+# Create output directory (start clean so stale module copies and
+# __pycache__ from earlier runs are never shipped)
 echo "📦 Creating package directory..."
+rm -rf "${OUTPUT_DIR}/${PACKAGE_NAME}"
 mkdir -p "${OUTPUT_DIR}/${PACKAGE_NAME}"
 
 # Copy .claude directory structure
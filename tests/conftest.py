@@ -3,6 +3,7 @@ Pytest configuration and fixtures for best-practice toolkit tests.
 """
 import importlib.util
 import os
+import shutil
 import sys
 import tempfile
 from pathlib import Path
@@ -10,10 +11,18 @@ from typing import Generator
 
 import pytest
 
-# Add project root to Python path and create mcp_servers module alias
+# PROJECT_PLAN.md of the shared optimization project scaffold
+OPTIMIZATION_PLAN = """# Optimization Engine
+
+## Problem
+Optimize delivery routes and resource allocation with constraints.
+
+## Solution
+Vehicle routing optimization using linear and constraint programming.
+"""
+# Create mcp_servers module alias (pytest.ini puts the project root on sys.path)
 # This allows importing from .claude/mcp-servers despite the hyphenated name
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 # Create module alias for .claude/mcp-servers -> mcp_servers
 mcp_servers_init = project_root / ".claude" / "mcp-servers" / "__init__.py"
@@ -85,6 +94,118 @@ def sample_objective_data() -> dict:
     }
 
 
+@pytest.fixture
+def sample_project_path() -> str:
+    """Sample project path for testing.
+
+    Returns:
+        Absolute path string (never created on disk)
+    """
+    return "/home/user/projects/test-project"
+
+
+@pytest.fixture
+def memory_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Create a MemoryServer storing its data in the test's tmp_path.
+
+    Args:
+        tmp_path: Pytest tmp_path fixture
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        MemoryServer instance with MEMORY_DIR pointed at tmp_path
+    """
+    import mcp_servers.memory_mcp as memory_module
+    monkeypatch.setattr(memory_module, 'MEMORY_DIR', tmp_path)
+    return memory_module.MemoryServer()
+
+
+@pytest.fixture
+def project_server():
+    """Create a ProjectServer.
+
+    Returns:
+        ProjectServer instance (project data lives under each test's project dir)
+    """
+    from mcp_servers.project_mcp import ProjectServer
+    return ProjectServer()
+
+
+@pytest.fixture
+def quality_server():
+    """Create a QualityServer.
+
+    Returns:
+        QualityServer instance
+    """
+    from mcp_servers.quality_mcp import QualityServer
+    return QualityServer()
+
+
+@pytest.fixture(scope="session")
+def learning_server_instance():
+    """LearningServer built once per test session (use learning_server in tests).
+
+    Returns:
+        Shared LearningServer instance
+    """
+    from mcp_servers.learning_mcp import LearningServer
+    return LearningServer()
+
+
+@pytest.fixture
+def learning_server(learning_server_instance, monkeypatch: pytest.MonkeyPatch):
+    """Shared LearningServer with its per-project state reset for this test.
+
+    The objective, domain and research domains start empty and whatever the
+    test sets (directly or through tool calls) is reverted afterwards.
+
+    Args:
+        learning_server_instance: Session-scoped LearningServer
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        LearningServer instance
+    """
+    monkeypatch.setattr(learning_server_instance, "project_objective", None)
+    monkeypatch.setattr(learning_server_instance, "project_domain", None)
+    monkeypatch.setattr(learning_server_instance, "research_domains", [])
+    return learning_server_instance
+
+
+@pytest.fixture(scope="session")
+def optimization_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project with an optimization PROJECT_PLAN.md, built once per session.
+
+    Read-only: tests that write into the project use optimization_project_copy.
+
+    Args:
+        tmp_path_factory: Pytest tmp_path_factory fixture
+
+    Returns:
+        Path to the shared project directory
+    """
+    project_dir = tmp_path_factory.mktemp("optimization") / "optimizer-project"
+    docs_dir = project_dir / "docs" / "notes"
+    docs_dir.mkdir(parents=True)
+    (docs_dir / "PROJECT_PLAN.md").write_text(OPTIMIZATION_PLAN)
+    return project_dir
+
+
+@pytest.fixture
+def optimization_project_copy(optimization_project: Path, tmp_path: Path) -> Path:
+    """Writable copy of the shared optimization project for this test.
+
+    Args:
+        optimization_project: Session-scoped optimization project
+        tmp_path: Pytest tmp_path fixture
+
+    Returns:
+        Path to the copied project directory
+    """
+    return Path(shutil.copytree(optimization_project, tmp_path / optimization_project.name))
+
+
 @pytest.fixture
 def mock_storage_dir(tmp_path: Path) -> Path:
     """Create a temporary storage directory for MCP data.
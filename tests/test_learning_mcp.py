@@ -4,31 +4,21 @@ Unit tests for Learning MCP - Project-Objective-Driven Features
 
 Tests the new domain-adaptive research capabilities.
 """
-import json
 import pytest
-import tempfile
-from pathlib import Path
-from datetime import datetime
-import sys
 
-# Add parent directory to path to import learning_mcp
-sys.path.insert(0, str(Path(__file__).parent.parent / ".claude" / "mcp-servers"))
-
-from learning_mcp import LearningServer
+# LearningServer instances come from the learning_server fixture (conftest.py)
 
 
 class TestProjectObjectiveDetection:
     """Test detect_project_objective functionality."""
 
-    def test_detect_objective_from_project_plan(self, tmp_path):
-        """Test detecting objective from PROJECT_PLAN.md."""
-        # Create a mock project with PROJECT_PLAN.md
+    def test_detect_objective_from_project_plan(self, learning_server, tmp_path):
+        """Test detecting objective from PROJECT_PLAN.md content."""
+        # Project dir names the project; the plan itself is passed in memory
         project_dir = tmp_path / "test-project"
         project_dir.mkdir()
-        docs_dir = project_dir / "docs" / "notes"
-        docs_dir.mkdir(parents=True)
 
-        # Create PROJECT_PLAN.md with sample content
+        # PROJECT_PLAN.md sample content
         plan_content = """# Test Project - Optimization Tool
 
 ## Problem
@@ -43,28 +33,25 @@ Build AI-powered optimization engine using constraint programming.
 ## Success
 Reduce planning time by 50% and improve resource utilization by 30%.
 """
-        plan_file = docs_dir / "PROJECT_PLAN.md"
-        plan_file.write_text(plan_content)
 
         # Test detection
-        server = LearningServer()
-        result = server.detect_project_objective(str(project_dir))
+        result = learning_server.detect_project_objective(str(project_dir), plan_text=plan_content)
 
         assert result["success"] is True
         assert "objective" in result
         objective = result["objective"]
         assert objective["project_name"] == "test-project"
+        assert objective["plan_file"] is None
         assert "optimize" in objective.get("problem", "").lower()
         assert "operations managers" in objective.get("target_users", "").lower()
         assert "constraint programming" in objective.get("solution", "").lower()
 
-    def test_detect_objective_missing_plan(self, tmp_path):
+    def test_detect_objective_missing_plan(self, learning_server, tmp_path):
         """Test error handling when PROJECT_PLAN.md doesn't exist."""
         project_dir = tmp_path / "no-plan-project"
         project_dir.mkdir()
 
-        server = LearningServer()
-        result = server.detect_project_objective(str(project_dir))
+        result = learning_server.detect_project_objective(str(project_dir))
 
         assert "error" in result
         assert "PROJECT_PLAN.md not found" in result["error"]
@@ -74,86 +61,47 @@ Reduce planning time by 50% and improve resource utilization by 30%.
 class TestDomainMapping:
     """Test map_objective_to_domains functionality."""
 
-    def test_map_optimization_domain(self):
-        """Test mapping optimization keywords to optimization domain."""
-        server = LearningServer()
-
-        objective_data = {
-            "objective": {
-                "project_name": "task-optimizer",
-                "title": "Task Optimization System",
-                "problem": "Need to optimize resource allocation and minimize costs",
-                "solution": "Use linear programming solver with constraint satisfaction"
-            }
-        }
-
-        result = server.map_objective_to_domains(objective_data)
+    @pytest.mark.parametrize("objective,expected_domain,source_keywords", [
+        pytest.param({
+            "project_name": "task-optimizer",
+            "title": "Task Optimization System",
+            "problem": "Need to optimize resource allocation and minimize costs",
+            "solution": "Use linear programming solver with constraint satisfaction"
+        }, "optimization", ("optimization", "scipy"), id="optimization"),
+        pytest.param({
+            "project_name": "rapid-pm",
+            "title": "Rapid Project Management Tool",
+            "problem": "Teams need better sprint planning and backlog management",
+            "solution": "Agile project management tool with Scrum and Kanban support"
+        }, "project_management", ("scrum", "pmi", "agile"), id="project_management"),
+        pytest.param({
+            "project_name": "best-practice",
+            "title": "Claude Code Best Practices Toolkit",
+            "problem": "Need standardized Claude Code development patterns",
+            "solution": "MCP servers and skills for enforcing best practices"
+        }, "claude_development", ("anthropic", "claude"), id="claude_development"),
+    ])
+    def test_map_domain(self, learning_server, objective, expected_domain, source_keywords):
+        """Test mapping objective keywords to the expected primary domain and sources."""
+        result = learning_server.map_objective_to_domains({"objective": objective})
 
         assert result["success"] is True
-        assert "detected_domains" in result
         assert len(result["detected_domains"]) > 0
+        assert result["primary_domain"] == expected_domain
 
-        # Primary domain should be optimization
-        assert result["primary_domain"] == "optimization"
-
-        # Should have optimization sources
-        sources = result["recommended_sources"]
-        assert any("optimization" in s.lower() or "scipy" in s.lower() for s in sources)
-
-    def test_map_project_management_domain(self):
-        """Test mapping PM keywords to project_management domain."""
-        server = LearningServer()
-
-        objective_data = {
-            "objective": {
-                "project_name": "rapid-pm",
-                "title": "Rapid Project Management Tool",
-                "problem": "Teams need better sprint planning and backlog management",
-                "solution": "Agile project management tool with Scrum and Kanban support"
-            }
-        }
-
-        result = server.map_objective_to_domains(objective_data)
-
-        assert result["success"] is True
-        assert result["primary_domain"] == "project_management"
-
-        # Should have PM-specific sources
+        # Should have domain-specific sources
         sources = result["recommended_sources"]
-        assert any("scrum" in s.lower() or "pmi" in s.lower() or "agile" in s.lower() for s in sources)
-
-    def test_map_claude_development_domain(self):
-        """Test mapping Claude/MCP keywords to claude_development domain."""
-        server = LearningServer()
-
-        objective_data = {
-            "objective": {
-                "project_name": "best-practice",
-                "title": "Claude Code Best Practices Toolkit",
-                "problem": "Need standardized Claude Code development patterns",
-                "solution": "MCP servers and skills for enforcing best practices"
-            }
-        }
-
-        result = server.map_objective_to_domains(objective_data)
-
-        assert result["success"] is True
-        assert result["primary_domain"] == "claude_development"
-
-        # Should have Claude/Anthropic sources
-        sources = result["recommended_sources"]
-        assert any("anthropic" in s.lower() or "claude" in s.lower() for s in sources)
+        assert any(keyword in s.lower() for s in sources for keyword in source_keywords)
 
 
 class TestDomainAdaptiveResearch:
     """Test research_domain_topic functionality."""
 
-    def test_research_optimization_topic(self):
+    def test_research_optimization_topic(self, learning_server):
         """Test generating research plan for optimization topic."""
-        server = LearningServer()
-        server.project_domain = "optimization"  # Set domain
+        learning_server.project_domain = "optimization"  # Set domain
 
-        result = server.research_domain_topic(topic="constraint solving")
+        result = learning_server.research_domain_topic(topic="constraint solving")
 
         assert result["success"] is True
         assert result["domain"] == "optimization"
@@ -169,12 +117,11 @@ class TestDomainAdaptiveResearch:
         sources = result["recommended_sources"]
         assert len(sources) > 0
 
-    def test_research_pm_topic(self):
+    def test_research_pm_topic(self, learning_server):
         """Test generating research plan for PM topic."""
-        server = LearningServer()
-        server.project_domain = "project_management"
+        learning_server.project_domain = "project_management"
 
-        result = server.research_domain_topic(topic="sprint planning")
+        result = learning_server.research_domain_topic(topic="sprint planning")
 
         assert result["success"] is True
         assert result["domain"] == "project_management"
@@ -184,27 +131,12 @@ class TestDomainAdaptiveResearch:
         assert any("sprint planning" in q.lower() for q in queries)
         assert any("agile" in q.lower() or "scrum" in q.lower() for q in queries)
 
-    def test_research_with_auto_detect_domain(self, tmp_path):
+    def test_research_with_auto_detect_domain(self, learning_server, optimization_project):
         """Test auto-detecting domain from project_path."""
-        # Create project with PROJECT_PLAN.md indicating optimization
-        project_dir = tmp_path / "optimizer-project"
-        docs_dir = project_dir / "docs" / "notes"
-        docs_dir.mkdir(parents=True)
-
-        plan_content = """# Optimizer
-
-## Problem
-Optimize resource allocation with constraints.
-
-## Solution
-Linear programming solver.
-"""
-        (docs_dir / "PROJECT_PLAN.md").write_text(plan_content)
-
-        server = LearningServer()
-        result = server.research_domain_topic(
+        # Shared project whose PROJECT_PLAN.md indicates optimization
+        result = learning_server.research_domain_topic(
             topic="linear programming",
-            project_path=str(project_dir)
+            project_path=str(optimization_project)
         )
 
         assert result["success"] is True
@@ -214,13 +146,12 @@ Linear programming solver.
 class TestProjectSpecificStorage:
     """Test store_learning and get_learnings with project-specific storage."""
 
-    def test_store_learning_to_project(self, tmp_path):
+    def test_store_learning_to_project(self, learning_server, tmp_path):
         """Test storing learning to project-specific location."""
         project_dir = tmp_path / "test-project"
         project_dir.mkdir()
 
-        server = LearningServer()
-        server.project_domain = "optimization"
+        learning_server.project_domain = "optimization"
 
         learning_data = {
             "domain": "optimization",
@@ -233,7 +164,7 @@ class TestProjectSpecificStorage:
             "recommendations": "Apply to resource allocation"
         }
 
-        result = server.store_learning(
+        result = learning_server.store_learning(
             topic="linear-programming",
             learning_data=learning_data,
             project_path=str(project_dir)
@@ -253,7 +184,7 @@ class TestProjectSpecificStorage:
         assert "simplex method" in content
         assert "scipy.optimize" in content
 
-    def test_get_learnings_from_project(self, tmp_path):
+    def test_get_learnings_from_project(self, learning_server, tmp_path):
         """Test retrieving learnings from project-specific location."""
         project_dir = tmp_path / "test-project"
         kb_dir = project_dir / "docs" / "references" / "domain-knowledge" / "optimization"
@@ -278,8 +209,7 @@ Constraint programming techniques for optimization.
 """
         (kb_dir / "constraint-programming.md").write_text(learning_content)
 
-        server = LearningServer()
-        result = server.get_learnings(project_path=str(project_dir))
+        result = learning_server.get_learnings(project_path=str(project_dir))
 
         assert result["success"] is True
         assert result["storage_type"] == "project-specific"
@@ -291,7 +221,7 @@ Constraint programming techniques for optimization.
         assert "constraint" in learning["topic"].lower()
         assert learning["format"] == "markdown"
 
-    def test_get_learnings_filter_by_domain(self, tmp_path):
+    def test_get_learnings_filter_by_domain(self, learning_server, tmp_path):
         """Test filtering learnings by domain."""
         project_dir = tmp_path / "multi-domain-project"
 
@@ -301,14 +231,13 @@ Constraint programming techniques for optimization.
             kb_dir.mkdir(parents=True)
             (kb_dir / f"{domain}-topic.md").write_text(f"# {domain} topic\n\n**Domain**: {domain}")
 
-        server = LearningServer()
 
         # Get all learnings
-        result_all = server.get_learnings(project_path=str(project_dir))
+        result_all = learning_server.get_learnings(project_path=str(project_dir))
         assert result_all["count"] == 2
 
         # Filter by domain
-        result_filtered = server.get_learnings(
+        result_filtered = learning_server.get_learnings(
             project_path=str(project_dir),
             domain="optimization"
         )
@@ -316,14 +245,16 @@ Constraint programming techniques for optimization.
         assert result_filtered["learnings"][0]["domain"] == "optimization"
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestDynamicScanning:
-    """Test that scanning methods return WebFetch instructions instead of hardcoded data."""
+    """Test that scanning methods return WebFetch instructions instead of hardcoded data.
 
-    @pytest.mark.asyncio
-    async def test_scan_skills_returns_webfetch_instructions(self):
+    All tests run on the session's event loop instead of a new loop each.
+    """
+
+    async def test_scan_skills_returns_webfetch_instructions(self, learning_server):
         """Test that scan_anthropic_skills returns WebFetch instructions."""
-        server = LearningServer()
-        result = await server.scan_anthropic_skills()
+        result = await learning_server.scan_anthropic_skills()
 
         assert result["success"] is True
         assert result["method"] == "dynamic"
@@ -332,11 +263,9 @@ class TestDynamicScanning:
         assert "workflow" in result
         assert "WebFetch" in result["workflow"]
 
-    @pytest.mark.asyncio
-    async def test_scan_cookbooks_returns_domain_relevance(self):
+    async def test_scan_cookbooks_returns_domain_relevance(self, learning_server):
         """Test that scan_anthropic_cookbooks includes domain filtering."""
-        server = LearningServer()
-        result = await server.scan_anthropic_cookbooks()
+        result = await learning_server.scan_anthropic_cookbooks()
 
         assert result["success"] is True
         assert result["method"] == "dynamic"
@@ -348,11 +277,9 @@ class TestDynamicScanning:
         assert "project_management" in relevance
         assert "claude_development" in relevance
 
-    @pytest.mark.asyncio
-    async def test_scan_org_returns_domain_priority(self):
+    async def test_scan_org_returns_domain_priority(self, learning_server):
         """Test that scan_anthropic_org includes domain priority."""
-        server = LearningServer()
-        result = await server.scan_anthropic_org()
+        result = await learning_server.scan_anthropic_org()
 
         assert result["success"] is True
         assert "domain_priority" in result
@@ -366,36 +293,22 @@ class TestDynamicScanning:
 class TestEndToEndWorkflow:
     """Test complete workflow from objective detection to research storage."""
 
-    def test_complete_research_workflow(self, tmp_path):
+    def test_complete_research_workflow(self, learning_server, optimization_project_copy):
         """Test full workflow: detect objective → map domain → research → store."""
-        # Setup: Create project with PROJECT_PLAN.md
-        project_dir = tmp_path / "research-test-project"
-        docs_dir = project_dir / "docs" / "notes"
-        docs_dir.mkdir(parents=True)
-
-        plan_content = """# Optimization Engine
-
-## Problem
-Optimize delivery routes for logistics company.
-
-## Solution
-Vehicle routing optimization using constraint programming.
-"""
-        (docs_dir / "PROJECT_PLAN.md").write_text(plan_content)
-
-        server = LearningServer()
+        # Setup: Writable copy of the shared project with PROJECT_PLAN.md
+        project_dir = optimization_project_copy
 
         # Step 1: Detect objective
-        obj_result = server.detect_project_objective(str(project_dir))
+        obj_result = learning_server.detect_project_objective(str(project_dir))
         assert obj_result["success"] is True
 
         # Step 2: Map to domains
-        domain_result = server.map_objective_to_domains(obj_result)
+        domain_result = learning_server.map_objective_to_domains(obj_result)
         assert domain_result["success"] is True
         assert domain_result["primary_domain"] == "optimization"
 
         # Step 3: Generate research plan
-        research_result = server.research_domain_topic(
+        research_result = learning_server.research_domain_topic(
             topic="vehicle routing",
             project_path=str(project_dir)
         )
@@ -413,7 +326,7 @@ Vehicle routing optimization using constraint programming.
             "recommendations": "Apply to delivery route planning"
         }
 
-        store_result = server.store_learning(
+        store_result = learning_server.store_learning(
             topic="vehicle-routing",
             learning_data=learning_data,
             project_path=str(project_dir)
@@ -422,15 +335,10 @@ Vehicle routing optimization using constraint programming.
         assert store_result["storage_type"] == "project-specific"
 
         # Step 5: Retrieve stored learning
-        get_result = server.get_learnings(
+        get_result = learning_server.get_learnings(
             project_path=str(project_dir),
             domain="optimization"
         )
         assert get_result["success"] is True
         assert get_result["count"] == 1
         assert "vehicle" in get_result["learnings"][0]["topic"].lower()
-
-
-if __name__ == "__main__":
-    # Run tests with pytest
-    pytest.main([__file__, "-v", "--tb=short"])
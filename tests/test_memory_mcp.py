@@ -1,42 +1,17 @@
 """
 Tests for Memory MCP server.
 """
-import shutil
-import tempfile
-from pathlib import Path
+import os
+from datetime import datetime
 
 import pytest
 
-from mcp_servers.memory_mcp import MemoryServer
-
-
-@pytest.fixture
-def temp_memory_dir():
-    """Create temporary memory directory for testing."""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-    # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-@pytest.fixture
-def memory_server(temp_memory_dir, monkeypatch):
-    """Create MemoryServer instance with temporary storage."""
-    import mcp_servers.memory_mcp as memory_module
-    monkeypatch.setattr(memory_module, 'MEMORY_DIR', temp_memory_dir)
-    server = MemoryServer()
-    return server
-
-
-@pytest.fixture
-def sample_project_path():
-    """Sample project path for testing."""
-    return "/home/user/projects/test-project"
+from mcp_servers.memory_mcp import MemoryServer, now_iso
 
 
 @pytest.fixture
 def sample_objective_data():
-    """Sample objective data for testing."""
+    """Sample objective data for testing (overrides conftest; searched for "Test problem")."""
     return {
         "problem": "Test problem statement",
         "target_users": "Test users",
@@ -56,10 +31,10 @@ class TestMemoryServer:
         project_id = memory_server.get_project_id(project_path)
         assert project_id == "my_test_project"
 
-    def test_get_project_file(self, memory_server, sample_project_path, temp_memory_dir):
+    def test_get_project_file(self, memory_server, sample_project_path, tmp_path):
         """Test project file path generation."""
         project_file = memory_server.get_project_file(sample_project_path)
-        expected_file = temp_memory_dir / "test-project.json"
+        expected_file = tmp_path / "test-project.json"
         assert project_file == expected_file
 
     def test_load_project_data_new_project(self, memory_server, sample_project_path):
@@ -98,6 +73,34 @@ class TestMemoryServer:
         assert loaded_data["sessions"] == test_data["sessions"]
         assert "updated_at" in loaded_data
 
+    def test_load_project_data_sees_external_changes(self, memory_server, sample_project_path):
+        """Test cached project data is re-read when the file changes on disk."""
+        memory_server.save_session_summary(sample_project_path, "Cached session")
+        memory_server.load_project_data(sample_project_path)
+
+        # Another server instance (separate cache) writes the same project
+        other = MemoryServer()
+        other.save_session_summary(sample_project_path, "External session")
+
+        data = memory_server.load_project_data(sample_project_path)
+        assert [s["summary"] for s in data["sessions"]] == ["Cached session", "External session"]
+
+    def test_load_project_data_sees_same_size_replacement(self, memory_server, sample_project_path):
+        """Test a same-size file swapped in with the same mtime is not served from cache."""
+        data = memory_server.load_project_data(sample_project_path)
+        data["current_status"] = "active"
+        memory_server.save_project_data(sample_project_path, data)
+        memory_server.load_project_data(sample_project_path)
+
+        project_file = memory_server.get_project_file(sample_project_path)
+        old_stat = project_file.stat()
+        replacement = project_file.with_name("replacement.tmp")
+        replacement.write_bytes(project_file.read_bytes().replace(b'"active"', b'"paused"'))
+        os.utime(replacement, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+        os.replace(replacement, project_file)
+
+        assert memory_server.load_project_data(sample_project_path)["current_status"] == "paused"
+
     def test_save_session_summary(self, memory_server, sample_project_path):
         """Test saving session summary."""
         result = memory_server.save_session_summary(
@@ -121,6 +124,22 @@ class TestMemoryServer:
         assert len(session["next_steps"]) == 2
         assert len(session["blockers"]) == 1
 
+    def test_session_timestamps_keep_microseconds(self, memory_server, sample_project_path, monkeypatch):
+        """Test stored timestamps match datetime.now().isoformat(), sub-second part included."""
+        monkeypatch.setattr("mcp_servers.memory_mcp.time.time_ns", lambda: 1_700_000_000_123_456_789)
+
+        memory_server.save_session_summary(sample_project_path, "First")
+        session = memory_server.load_project_data(sample_project_path)["sessions"][0]
+        expected = datetime.fromtimestamp(1_700_000_000).replace(microsecond=123456).isoformat()
+        assert session["timestamp"] == expected
+
+    def test_now_iso_matches_datetime_now(self):
+        """Test now_iso falls between two datetime.now() readings."""
+        before = datetime.now().isoformat()
+        stamp = now_iso()
+        after = datetime.now().isoformat()
+        assert before <= stamp <= after
+
     def test_save_session_summary_keeps_last_10(self, memory_server, sample_project_path):
         """Test that only last 10 sessions are kept."""
         # Save 15 sessions
@@ -136,6 +155,77 @@ class TestMemoryServer:
         assert data["sessions"][0]["summary"] == "Session 5"
         assert data["sessions"][-1]["summary"] == "Session 14"
 
+    def test_save_decision_appends_to_event_log(self, memory_server, sample_project_path):
+        """Test sessions/decisions on existing projects are appended, not rewritten."""
+        memory_server.save_session_summary(sample_project_path, "First session")
+        project_file = memory_server.get_project_file(sample_project_path)
+        snapshot = project_file.read_bytes()
+
+        memory_server.save_decision(sample_project_path, "Use SQLite", "Single file")
+
+        assert project_file.read_bytes() == snapshot
+        assert memory_server.get_events_file(project_file).exists()
+        assert len(MemoryServer().load_project_data(sample_project_path)["decisions"]) == 1
+
+    def test_save_project_data_compacts_event_log(self, memory_server, sample_project_path):
+        """Test a full save folds the event log into the project file."""
+        memory_server.save_session_summary(sample_project_path, "Session 1")
+        memory_server.save_session_summary(sample_project_path, "Session 2")
+        project_file = memory_server.get_project_file(sample_project_path)
+
+        data = memory_server.load_project_data(sample_project_path)
+        memory_server.save_project_data(sample_project_path, data)
+
+        assert not memory_server.get_events_file(project_file).exists()
+        sessions = MemoryServer().load_project_data(sample_project_path)["sessions"]
+        assert [s["summary"] for s in sessions] == ["Session 1", "Session 2"]
+
+    def test_compaction_crash_does_not_duplicate_events(self, memory_server, sample_project_path):
+        """Test an event log left behind by an interrupted compaction is not replayed twice."""
+        memory_server.save_session_summary(sample_project_path, "Session 1")
+        memory_server.save_session_summary(sample_project_path, "Session 2")
+        memory_server.save_decision(sample_project_path, "Use SQLite", "Single file")
+        events_file = memory_server.get_events_file(memory_server.get_project_file(sample_project_path))
+        events = events_file.read_bytes()
+
+        # Crash after the snapshot is written but before the log is removed
+        data = memory_server.load_project_data(sample_project_path)
+        memory_server.save_project_data(sample_project_path, data)
+        events_file.write_bytes(events)
+
+        data = MemoryServer().load_project_data(sample_project_path)
+        assert [s["summary"] for s in data["sessions"]] == ["Session 1", "Session 2"]
+        assert len(data["decisions"]) == 1
+
+    @pytest.mark.parametrize("call", [
+        lambda server, path: server.save_session_summary(path, "Unsaved session"),
+        lambda server, path: server.save_decision(path, "Unsaved decision", "Disk full"),
+        lambda server, path: server.save_project_objective(path, {"problem": "Unsaved objective"}),
+    ])
+    def test_failed_call_leaves_no_cached_change(self, memory_server, sample_project_path, monkeypatch, call):
+        """Test a write that fails does not leave its change in the cache."""
+        import mcp_servers.memory_mcp as memory_module
+
+        memory_server.save_session_summary(sample_project_path, "Saved session")
+        before = memory_server.load_project_context(sample_project_path)
+
+        def disk_full(*args, **kwargs):
+            raise OSError(28, "No space left on device")
+
+        def open_read_only(file, mode='r', *args, **kwargs):
+            if 'r' not in mode:
+                disk_full()
+            return open(file, mode, *args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr(memory_module, "atomic_write", disk_full)
+            m.setattr(memory_module, "open", open_read_only, raising=False)
+            with pytest.raises(OSError):
+                call(memory_server, sample_project_path)
+
+        assert memory_server.load_project_context(sample_project_path) == before
+        assert memory_server.load_project_data(sample_project_path)["event_seq"] == 1
+
     def test_load_project_context(self, memory_server, sample_project_path):
         """Test loading project context."""
         # Save some sessions and decisions
@@ -155,9 +245,24 @@ class TestMemoryServer:
         assert context["project_id"] == "test-project"
         assert context["project_path"] == sample_project_path
         assert len(context["recent_sessions"]) == 1
-        assert len(context["all_decisions"]) == 1
+        assert len(context["recent_decisions"]) == 1
+        assert context["decision_count"] == 1
         assert context["current_status"] == "active"
 
+    def test_load_project_context_caps_decisions(self, memory_server, sample_project_path):
+        """Test load_project_context returns only recent decisions, list_decisions pages the rest."""
+        for i in range(25):
+            memory_server.save_decision(sample_project_path, f"Decision {i}", "Rationale")
+
+        context = memory_server.load_project_context(sample_project_path)
+        assert len(context["recent_decisions"]) == 20
+        assert context["recent_decisions"][0]["decision"] == "Decision 5"
+        assert context["decision_count"] == 25
+
+        page = memory_server.list_decisions(sample_project_path, offset=0, limit=5)
+        assert [d["decision"] for d in page["decisions"]] == [f"Decision {i}" for i in range(5)]
+        assert page["total"] == 25
+
     def test_load_project_context_returns_last_3_sessions(self, memory_server, sample_project_path):
         """Test that load_project_context returns only last 3 sessions."""
         # Save 5 sessions
@@ -219,6 +324,39 @@ class TestMemoryServer:
         assert "session_count" in project
         assert "has_objective" in project
 
+    def test_list_projects_reads_summaries_without_parsing(self, memory_server, monkeypatch):
+        """Test a fresh server lists unchanged projects from the index, not the JSON files."""
+        memory_server.save_session_summary("/home/user/project1", "Project 1 session")
+        memory_server.save_session_summary("/home/user/project1", "Another session")
+
+        other = MemoryServer()
+        monkeypatch.setattr(other, "_read_project", None)  # Any parse would fail
+
+        result = other.list_projects()
+        assert result["total_projects"] == 1
+        assert result["projects"][0]["session_count"] == 2
+        assert result["projects"][0]["has_objective"] is False
+
+    def test_list_projects_without_search_index(self, memory_server):
+        """Test listing falls back to reading project files when the index is disabled."""
+        memory_server.get_search_index().db = None
+        memory_server.save_session_summary("/home/user/project1", "Project 1 session")
+        memory_server.save_session_summary("/home/user/project2", "Project 2 session")
+
+        result = memory_server.list_projects()
+        assert result["total_projects"] == 2
+        assert {p["project_path"] for p in result["projects"]} == {"/home/user/project1", "/home/user/project2"}
+
+    def test_list_projects_skips_unreadable_files(self, memory_server, tmp_path):
+        """Test corrupt or misshapen project files are skipped instead of breaking listing/search."""
+        memory_server.save_session_summary("/home/user/project1", "Project 1 session")
+        (tmp_path / "broken.json").write_text("{not json")
+        (tmp_path / "list.json").write_text("[]")
+        (tmp_path / "shape.json").write_text('{"project_id": "shape", "sessions": "session", "decisions": []}')
+
+        assert memory_server.list_projects()["total_projects"] == 1
+        assert memory_server.search_memory("session")["total_results"] == 1
+
     def test_search_memory_in_sessions(self, memory_server):
         """Test searching in session summaries."""
         memory_server.save_session_summary(
@@ -273,6 +411,38 @@ class TestMemoryServer:
         assert result["total_results"] == 0
         assert result["results"] == []
 
+    def test_search_memory_matches_partial_words(self, memory_server):
+        """Test search index still supports substring queries."""
+        memory_server.save_session_summary("/home/user/project1", "Implemented authentication system")
+
+        result = memory_server.search_memory("thentic")
+
+        assert result["total_results"] == 1
+
+    def test_search_memory_short_query(self, memory_server):
+        """Test queries shorter than an index trigram still match."""
+        memory_server.save_session_summary("/home/user/project1", "Moved CI to GitHub Actions")
+        memory_server.save_session_summary("/home/user/project2", "Refactored parser")
+
+        result = memory_server.search_memory("ci")
+
+        assert result["total_results"] == 1
+        assert result["results"][0]["project_id"] == "project1"
+
+    def test_search_memory_indexes_externally_written_files(self, memory_server, tmp_path):
+        """Test files written outside the server are picked up by the index."""
+        memory_server.save_session_summary("/home/user/project1", "Some content")
+        memory_server.search_memory("content")
+
+        # Simulate another process writing a project file directly
+        other = MemoryServer()
+        other.save_session_summary("/home/user/project2", "Migrated to GraphQL")
+
+        result = memory_server.search_memory("graphql")
+
+        assert result["total_results"] == 1
+        assert result["results"][0]["project_id"] == "project2"
+
     def test_save_project_objective(self, memory_server, sample_project_path, sample_objective_data):
         """Test saving project objective."""
         result = memory_server.save_project_objective(
@@ -305,10 +475,10 @@ class TestMemoryServer:
         assert result["found"] is False
         assert "message" in result
 
-    def test_get_storage_dir(self, memory_server, temp_memory_dir):
+    def test_get_storage_dir(self, memory_server, tmp_path):
         """Test getting storage directory."""
         storage_dir = memory_server.get_storage_dir()
-        assert storage_dir == temp_memory_dir
+        assert storage_dir == tmp_path
 
     def test_save_session_with_minimal_data(self, memory_server, sample_project_path):
         """Test saving session with only required fields."""